@@ -0,0 +1,13 @@
+"""
+benchmarks
+==========
+Offline performance benchmarks for the repository's Python tooling:
+
+- ``SourceInspectionLibrary`` keywords on a synthetic C tree;
+- ``OpenOcdLibrary`` keywords against a latency-injecting fake OpenOCD
+  Telnet server;
+- ``scripts/arxml_model.py`` and ``scripts/ai.py`` on a synthetic
+  multi-file AUTOSAR project.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,69 @@
+"""
+bench_arxml.py
+==============
+Benchmarks for ``scripts/arxml_model.py`` and ``scripts/ai.py`` against a
+synthetic multi-file AUTOSAR project (see `generators.generate_arxml`).
+
+Covers single-file parsing, reference resolution, cold multi-file loads
+(serial and process-pool), warm cache hits, incremental reloads after one
+file changes, index queries and an end-to-end ``ai.py`` run.
+"""
+
+import os
+import subprocess
+import sys
+
+from arxml_model import build_model, load_project, merge_fragments, parse_arxml
+
+from .generators import generate_arxml
+
+GROUP = "arxml"
+
+
+def cases(ctx):
+    scale = ctx.scale
+    arxml_dir = ctx.workdir / "arxml"
+    cache_dir = ctx.workdir / "arxml_cache"
+    files = generate_arxml(arxml_dir, swcs=scale["swcs"], files=scale["arxml_files"],
+                           seed=ctx.seed)
+    sources = [str(arxml_dir)]
+    jobs = ctx.jobs or os.cpu_count() or 1
+
+    yield "arxml.parse_arxml.interfaces_file", lambda: parse_arxml(files[0])
+    yield "arxml.parse_arxml.swc_file", lambda: parse_arxml(files[1])
+
+    merged, _ = merge_fragments((str(f), parse_arxml(f)) for f in files)
+    yield "arxml.build_model", lambda: build_model(merged)
+
+    yield "arxml.load_project.cold.serial", \
+        lambda: load_project(sources, use_cache=False, jobs=1)
+    yield "arxml.load_project.cold.parallel", \
+        lambda: load_project(sources, use_cache=False, jobs=jobs)
+
+    model = load_project(sources, cache_dir=cache_dir, jobs=jobs)
+    yield "arxml.load_project.warm", lambda: load_project(sources, cache_dir=cache_dir)
+
+    # Every call rewrites one SWC file with new content, so each load
+    # reparses exactly one file and re-merges the rest from the cache.
+    touched = files[-1]
+    original = touched.read_text(encoding="utf-8")
+    counter = [0]
+
+    def incremental():
+        counter[0] += 1
+        touched.write_text(f"{original}<!-- bench {counter[0]} -->\n", encoding="utf-8")
+        return load_project(sources, cache_dir=cache_dir, jobs=jobs)
+
+    try:
+        yield "arxml.load_project.incremental", incremental
+    finally:
+        touched.write_text(original, encoding="utf-8")
+
+    signal = next(iter(model.data_element_interfaces))
+    yield "arxml.query.exchanges", lambda: model.exchanges(signal)
+    yield "arxml.query.ports_of", lambda: model.ports_of("Swc0")
+
+    ai_cmd = [sys.executable, str(ctx.repo / "scripts" / "ai.py"), *sources,
+              "--cache-dir", str(cache_dir)]
+    yield "arxml.ai_py.warm", \
+        lambda: subprocess.run(ai_cmd, stdout=subprocess.DEVNULL, check=True)
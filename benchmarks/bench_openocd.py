@@ -0,0 +1,69 @@
+"""
+bench_openocd.py
+================
+Benchmarks for every target-facing ``OpenOcdLibrary`` keyword against
+`fake_openocd.FakeOpenOcdServer`, over two transports:
+
+- ``loopback``  – plain TCP on 127.0.0.1, no injected delay (library and
+  socket overhead only);
+- ``latencyN``  – N ms injected per command, approximating a KitProg3 /
+  CMSIS-DAP round trip.
+
+``Start OpenOCD`` / ``Stop OpenOCD`` are not covered: they launch the real
+OpenOCD binary and need an attached probe.
+"""
+
+from OpenOcdLibrary import OpenOcdLibrary
+
+from .fake_openocd import FakeOpenOcdServer
+
+GROUP = "openocd"
+
+# Register contents matching a correctly initialised board (see
+# tests/resources/variables.resource).
+_MEMORY = {
+    0x403103C4: 0x2,    # P7  PRT_PC – PORT_DM_PULLUP
+    0x403109C4: 0x6,    # P19 PRT_PC – PORT_DM_STRONG
+    0x40310980: 0x1,    # P19 PRT_DR – LED1 off (active-LOW)
+}
+
+
+def _transport_cases(label: str, server: FakeOpenOcdServer):
+    def open_close():
+        lib = OpenOcdLibrary()
+        lib.open_openocd_connection(port=server.port, retries=1)
+        lib.close_openocd_connection()
+
+    yield f"openocd.{label}.open_close_connection", open_close
+
+    lib = OpenOcdLibrary()
+    lib.open_openocd_connection(port=server.port, retries=1)
+    try:
+        yield f"openocd.{label}.halt_target", lib.halt_target
+        yield f"openocd.{label}.resume_target", lib.resume_target
+        yield f"openocd.{label}.reset_and_halt_target", lib.reset_and_halt_target
+        yield f"openocd.{label}.reset_and_run_target", lib.reset_and_run_target
+        yield f"openocd.{label}.read_register", \
+            lambda: lib.read_register("0x403103C4")
+        yield f"openocd.{label}.write_register", \
+            lambda: lib.write_register("0x40310100", "0x00000001")
+        yield f"openocd.{label}.read_register_bits", \
+            lambda: lib.read_register_bits("0x403109C4", 0, 3)
+        yield f"openocd.{label}.register_bits_should_equal", \
+            lambda: lib.register_bits_should_equal("0x403103C4", 0, 3, 2)
+        yield f"openocd.{label}.set_breakpoint", \
+            lambda: lib.set_breakpoint("0x08001234")
+        yield f"openocd.{label}.remove_breakpoint", \
+            lambda: lib.remove_breakpoint("0x08001234")
+        yield f"openocd.{label}.send_raw_command", \
+            lambda: lib.send_raw_command("reg pc")
+    finally:
+        lib.close_openocd_connection()
+
+
+def cases(ctx):
+    latency_ms = ctx.scale["openocd_latency_ms"]
+    transports = (("loopback", 0.0), (f"latency{latency_ms:g}ms", latency_ms / 1000.0))
+    for label, latency in transports:
+        with FakeOpenOcdServer(latency=latency, memory=_MEMORY) as server:
+            yield from _transport_cases(label, server)
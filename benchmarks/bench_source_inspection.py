@@ -0,0 +1,59 @@
+"""
+bench_source_inspection.py
+==========================
+Benchmarks for every ``SourceInspectionLibrary`` keyword against a synthetic
+C tree (see `generators.generate_c_tree`).
+
+Single-file keywords run against the large generated ``main.c`` or
+``Gen_Cfg.c``; the ``tree_scan`` cases apply a keyword to every unit in the
+tree, the way an architecture rule would be checked across ``src/``.
+"""
+
+from SourceInspectionLibrary import SourceInspectionLibrary
+
+from .generators import generate_c_tree
+
+GROUP = "sil"
+
+
+def cases(ctx):
+    scale = ctx.scale
+    tree = generate_c_tree(ctx.workdir / "ctree", files=scale["c_files"],
+                           depth=scale["c_depth"],
+                           config_entries=scale["config_entries"], seed=ctx.seed)
+    lib = SourceInspectionLibrary()
+    main_c = str(tree["main_c"])
+    config_c = str(tree["config_c"])
+    units = [str(p) for p in tree["units"]]
+
+    yield "sil.file_should_contain_pattern", \
+        lambda: lib.file_should_contain_pattern(main_c, r"SwcLedToggle_Run10ms\(\)")
+    yield "sil.file_should_not_contain_pattern", \
+        lambda: lib.file_should_not_contain_pattern(config_c, r"0x5031")
+    yield "sil.file_should_contain_text", \
+        lambda: lib.file_should_contain_text(main_c, "SwcLedToggle_Run10ms()")
+    yield "sil.file_should_not_contain_text", \
+        lambda: lib.file_should_not_contain_text(config_c, "(volatile")
+    yield "sil.count_pattern_occurrences", \
+        lambda: lib.count_pattern_occurrences(config_c, r"0x4031")
+    yield "sil.get_matching_lines", \
+        lambda: lib.get_matching_lines(config_c, r"0x4031000[0-4]")
+    yield "sil.first_occurrence_should_precede_second", \
+        lambda: lib.first_occurrence_should_precede_second(
+            main_c, r"Os_WaitTick10ms\(\);", r"SwcLedToggle_Run10ms\(\);")
+    yield "sil.same_loop_block_should_contain", \
+        lambda: lib.same_loop_block_should_contain(
+            main_c, r"Os_WaitTick10ms\(\);", r"SwcLedToggle_Run10ms")
+    yield "sil.extract_integer_from_source", \
+        lambda: lib.extract_integer_from_source(
+            main_c, r"volatile\s+uint32\s+n\s*=\s*(\d+)")
+
+    def tree_scan_not_contain():
+        for unit in units:
+            lib.file_should_not_contain_pattern(unit, r"REG32")
+
+    def tree_scan_count():
+        return sum(lib.count_pattern_occurrences(unit, r"IoHwAb_Write_Led1") for unit in units)
+
+    yield "sil.tree_scan.file_should_not_contain_pattern", tree_scan_not_contain
+    yield "sil.tree_scan.count_pattern_occurrences", tree_scan_count
@@ -0,0 +1,112 @@
+"""
+fake_openocd.py
+===============
+In-process stand-in for the OpenOCD Telnet server, with injectable latency.
+
+Speaks enough of the OpenOCD Telnet protocol for every ``OpenOcdLibrary``
+keyword that talks to the target: a banner ending in the ``> `` prompt,
+command echo, ``mdw`` / ``mww`` against a sparse 32-bit memory map, and
+plain acknowledgements for ``halt``, ``resume``, ``reset``, ``bp``, ``rbp``
+and ``exit``.  No board, adapter or OpenOCD binary is needed.
+
+Usage
+-----
+::
+
+    with FakeOpenOcdServer(latency=0.002) as server:
+        lib = OpenOcdLibrary()
+        lib.open_openocd_connection(port=server.port)
+        lib.read_register(0x403103C4)
+"""
+
+import re
+import socketserver
+import threading
+import time
+from typing import Dict, Optional
+
+
+_MDW = re.compile(r"^mdw\s+(\S+)")
+_MWW = re.compile(r"^mww\s+(\S+)\s+(\S+)")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: "FakeOpenOcdServer" = self.server.owner
+        self.wfile.write(b"Open On-Chip Debugger\r\n> ")
+        for raw in self.rfile:
+            cmd = raw.decode("ascii", errors="replace").strip()
+            if server.latency:
+                time.sleep(server.latency)
+            if cmd == "exit":
+                return
+            reply = server.execute(cmd)
+            self.wfile.write(f"{cmd}\r\n{reply}> ".encode("ascii"))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeOpenOcdServer:
+    """Threaded fake OpenOCD Telnet server bound to ``127.0.0.1``.
+
+    Arguments:
+    - ``latency`` – seconds slept before answering each command (default: 0)
+    - ``port``    – TCP port to bind; ``0`` picks a free port (default: 0)
+    - ``memory``  – initial ``{address: value}`` map; unset words read as 0
+    """
+
+    def __init__(self, latency: float = 0.0, port: int = 0,
+                 memory: Optional[Dict[int, int]] = None) -> None:
+        self.latency = float(latency)
+        self.memory: Dict[int, int] = dict(memory or {})
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", int(port)), _Handler)
+        self._server.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def execute(self, cmd: str) -> str:
+        """Return the response body (without prompt) for one command."""
+        m = _MDW.match(cmd)
+        if m:
+            addr = int(m.group(1), 0)
+            with self._lock:
+                value = self.memory.get(addr, 0)
+            return f"0x{addr:08x}: {value:08x} \r\n"
+        m = _MWW.match(cmd)
+        if m:
+            with self._lock:
+                self.memory[int(m.group(1), 0)] = int(m.group(2), 0) & 0xFFFFFFFF
+            return ""
+        if cmd.startswith("halt"):
+            return "target halted due to debug-request, current mode: Thread\r\n"
+        if cmd.startswith("reset"):
+            return "target halted due to debug-request\r\n" if "halt" in cmd else ""
+        if cmd.startswith(("resume", "bp", "rbp")):
+            return ""
+        return f"invalid command name \"{cmd.split(' ', 1)[0]}\"\r\n"
+
+    def start(self) -> "FakeOpenOcdServer":
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="fake-openocd", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeOpenOcdServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
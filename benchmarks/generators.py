@@ -0,0 +1,220 @@
+"""
+generators.py
+=============
+Deterministic synthetic workloads for the benchmark suite.
+
+- `generate_c_tree`  – a deeply nested C source tree with thousands of
+  translation units, a large generated configuration table and a
+  ``main.c``-style scheduler loop, shaped like ``src/``.
+- `generate_arxml`   – an AUTOSAR project with tens of thousands of SWCs
+  split over many ARXML files, shaped like ``scripts/example.arxml``.
+
+All output depends only on the arguments (including ``seed``), so two runs
+with the same parameters benchmark byte-identical inputs.  Each generator
+empties its output directory first, so a reused ``--workdir`` never mixes
+files from an earlier run at another scale or seed into the workload.
+"""
+
+import random
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+
+def _fresh_dir(path) -> Path:
+    """Return ``path`` as an existing, empty directory."""
+    path = Path(path)
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+    return path
+
+
+# ---------------------------------------------------------------------- #
+#  C source tree                                                           #
+# ---------------------------------------------------------------------- #
+
+_C_UNIT = """\
+/* {name}.c - generated benchmark unit */
+#include "Std_Types.h"
+#include "{header}.h"
+
+static uint8 {name}_state = 0u;
+
+{functions}
+"""
+
+_C_FUNCTION = """\
+void {name}_Run{idx}(void)
+{{
+    uint32 i;
+    for (i = 0u; i < {bound}u; i++)
+    {{
+        {name}_state ^= (uint8)(i & 0x{mask:02X}u);
+    }}
+    IoHwAb_Write_Led1({name}_state);
+}}
+"""
+
+_C_MAIN_TAIL = """\
+static FUNC(void, OS_CODE) Os_WaitTick10ms(void)
+{
+    volatile uint32 n = 480000UL;
+    while (n > 0u) { n--; }
+}
+
+int main(void)
+{
+    Port_Init();
+    while (1)
+    {
+        Os_WaitTick10ms();
+        SwcLedToggle_Run10ms();
+    }
+}
+"""
+
+
+def generate_c_tree(root, files: int = 2000, depth: int = 6,
+                    config_entries: int = 20000, seed: int = 1) -> Dict[str, object]:
+    """Write a synthetic C tree below ``root``, replacing its contents.
+
+    Arguments:
+    - ``files``          – number of ``.c`` translation units
+    - ``depth``          – maximum directory nesting depth
+    - ``config_entries`` – rows in the generated ``Gen_Cfg.c`` table
+    - ``seed``           – random seed
+
+    Returns ``{"root", "units", "config_c", "main_c"}`` with ``Path`` values
+    (``units`` is a list).
+    """
+    rng = random.Random(seed)
+    root = _fresh_dir(root)
+    units: List[Path] = []
+    for i in range(files):
+        parts = [f"mod{rng.randrange(8)}" for _ in range(rng.randint(1, depth))]
+        directory = root.joinpath(*parts)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f"Unit{i:05d}"
+        functions = "\n".join(
+            _C_FUNCTION.format(name=name, idx=j, bound=rng.randint(1, 1000),
+                               mask=rng.randrange(256))
+            for j in range(rng.randint(2, 12))
+        )
+        path = directory / f"{name}.c"
+        path.write_text(_C_UNIT.format(name=name, header=f"Mod{i % 64}",
+                                       functions=functions), encoding="utf-8")
+        units.append(path)
+
+    gen_dir = root / "config" / "GeneratedSource"
+    gen_dir.mkdir(parents=True, exist_ok=True)
+    rows = "\n".join(
+        f"    {{ 0x{0x40310000 + rng.randrange(32) * 0x80 + rng.choice((0x00, 0x10, 0x44)):08X}u, "
+        f"{rng.randrange(8)}u, {rng.randrange(32)}u, {rng.randrange(8)}u }},  /* entry {n} */"
+        for n in range(config_entries)
+    )
+    config_c = gen_dir / "Gen_Cfg.c"
+    config_c.write_text(
+        "/* Gen_Cfg.c - generated configuration table */\n"
+        '#include "Gen_Cfg.h"\n\n'
+        f"const Gen_CfgType Gen_Config[{config_entries}u] =\n{{\n{rows}\n}};\n",
+        encoding="utf-8",
+    )
+
+    # A large main.c: thousands of helper functions ahead of the scheduler
+    # loop, so keywords that look for the loop scan the whole file.
+    helpers = "\n".join(
+        _C_FUNCTION.format(name="Main", idx=j, bound=rng.randint(1, 1000),
+                           mask=rng.randrange(256))
+        for j in range(max(1, config_entries // 10))
+    )
+    main_c = root / "main.c"
+    main_c.write_text(
+        '#include "Std_Types.h"\n#include "SwcLedToggle.h"\n\n'
+        f"static uint8 Main_state = 0u;\n\n{helpers}\n{_C_MAIN_TAIL}",
+        encoding="utf-8",
+    )
+    return {"root": root, "units": units, "config_c": config_c, "main_c": main_c}
+
+
+# ---------------------------------------------------------------------- #
+#  ARXML                                                                   #
+# ---------------------------------------------------------------------- #
+
+_ARXML_HEAD = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+               '<AUTOSAR xmlns="http://autosar.org/schema/r4.0">\n<AR-PACKAGES>\n')
+_ARXML_TAIL = "</AR-PACKAGES>\n</AUTOSAR>\n"
+
+
+def _package(name: str, elements: List[str], subpackages: str = "") -> str:
+    body = f"<ELEMENTS>\n{''.join(elements)}</ELEMENTS>\n" if elements else ""
+    sub = f"<AR-PACKAGES>\n{subpackages}</AR-PACKAGES>\n" if subpackages else ""
+    return f"<AR-PACKAGE>\n<SHORT-NAME>{name}</SHORT-NAME>\n{body}{sub}</AR-PACKAGE>\n"
+
+
+def generate_arxml(out_dir, swcs: int = 10000, files: int = 32,
+                   ports_per_swc: int = 4, seed: int = 1) -> List[Path]:
+    """Write a synthetic AUTOSAR project of ``swcs`` SWCs over ``files`` files
+    into ``out_dir``, replacing its contents.
+
+    File 0 holds the ``/Interfaces`` and ``/DataTypes`` packages; SWCs are
+    spread evenly over ``/Swcs/PartNNN`` packages in the remaining files.
+    Interface references mix absolute paths and bare short names so both
+    resolution strategies of ``arxml_model`` are exercised.
+
+    Returns the written file paths.
+    """
+    rng = random.Random(seed)
+    out_dir = _fresh_dir(out_dir)
+    n_interfaces = max(1, swcs // 4)
+
+    types = [f"<APPLICATION-PRIMITIVE-DATA-TYPE><SHORT-NAME>{t}</SHORT-NAME>"
+             "</APPLICATION-PRIMITIVE-DATA-TYPE>\n"
+             for t in ("uint8", "uint16", "uint32", "boolean")]
+    interfaces = []
+    for i in range(n_interfaces):
+        elements = "".join(
+            f"<VARIABLE-DATA-PROTOTYPE><SHORT-NAME>Signal{i}_{j}</SHORT-NAME>"
+            f'<TYPE-TREF DEST="APPLICATION-PRIMITIVE-DATA-TYPE">/DataTypes/'
+            f"{rng.choice(('uint8', 'uint16', 'uint32', 'boolean'))}</TYPE-TREF>"
+            "</VARIABLE-DATA-PROTOTYPE>\n"
+            for j in range(rng.randint(1, 4))
+        )
+        interfaces.append(
+            f"<SENDER-RECEIVER-INTERFACE><SHORT-NAME>If{i}</SHORT-NAME>\n"
+            f"<DATA-ELEMENTS>\n{elements}</DATA-ELEMENTS>\n</SENDER-RECEIVER-INTERFACE>\n"
+        )
+
+    paths = [out_dir / "shared.arxml"]
+    paths[0].write_text(
+        _ARXML_HEAD + _package("Interfaces", interfaces) + _package("DataTypes", types)
+        + _ARXML_TAIL, encoding="utf-8")
+
+    parts = max(1, files - 1)
+    per_part = -(-swcs // parts)
+    for part in range(parts):
+        components = []
+        for s in range(part * per_part, min(swcs, (part + 1) * per_part)):
+            ports = []
+            for p in range(ports_per_swc):
+                target = rng.randrange(n_interfaces)
+                tref = f"/Interfaces/If{target}" if rng.random() < 0.8 else f"If{target}"
+                if rng.random() < 0.5:
+                    ports.append(
+                        f"<P-PORT-PROTOTYPE><SHORT-NAME>Out{p}</SHORT-NAME>"
+                        f'<PROVIDED-INTERFACE-TREF DEST="SENDER-RECEIVER-INTERFACE">{tref}'
+                        "</PROVIDED-INTERFACE-TREF></P-PORT-PROTOTYPE>\n")
+                else:
+                    ports.append(
+                        f"<R-PORT-PROTOTYPE><SHORT-NAME>In{p}</SHORT-NAME>"
+                        f'<REQUIRED-INTERFACE-TREF DEST="SENDER-RECEIVER-INTERFACE">{tref}'
+                        "</REQUIRED-INTERFACE-TREF></R-PORT-PROTOTYPE>\n")
+            components.append(
+                f"<APPLICATION-SOFTWARE-COMPONENT-TYPE><SHORT-NAME>Swc{s}</SHORT-NAME>\n"
+                f"<PORTS>\n{''.join(ports)}</PORTS>\n</APPLICATION-SOFTWARE-COMPONENT-TYPE>\n"
+            )
+        path = out_dir / f"swcs_{part:03d}.arxml"
+        path.write_text(
+            _ARXML_HEAD + _package("Swcs", [], _package(f"Part{part:03d}", components))
+            + _ARXML_TAIL, encoding="utf-8")
+        paths.append(path)
+    return paths
@@ -0,0 +1,268 @@
+"""
+runner.py
+=========
+Command-line driver for the benchmark suite.
+
+Generates the synthetic workloads in a scratch directory, times every
+benchmark case, writes the results as JSON and optionally compares them with
+a stored baseline.  Runs offline with the standard library only.
+
+Usage
+-----
+::
+
+    python -m benchmarks                          # full scale, all groups
+    python -m benchmarks --scale quick -g sil     # one group, small inputs
+    python -m benchmarks -k read_register         # cases whose name contains ...
+
+    python -m benchmarks -o benchmarks/results/baseline.json
+    python -m benchmarks --compare benchmarks/results/baseline.json
+
+``--compare`` exits with status 1 if any case is slower than the baseline by
+more than ``--threshold`` (default 10 %), or if a baseline case selected by
+``-g`` / ``-k`` did not run.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# The code under test is not packaged; import it the way Robot and the
+# scripts themselves do, straight from its directory.
+for _path in (REPO_ROOT / "scripts", REPO_ROOT / "tests" / "libraries"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+SCALES = {
+    "quick": {
+        "c_files": 300,
+        "c_depth": 4,
+        "config_entries": 5000,
+        "swcs": 1000,
+        "arxml_files": 8,
+        "openocd_latency_ms": 1.0,
+    },
+    "full": {
+        "c_files": 3000,
+        "c_depth": 8,
+        "config_entries": 50000,
+        "swcs": 12000,
+        "arxml_files": 48,
+        "openocd_latency_ms": 2.0,
+    },
+}
+
+# Benchmark modules, each exposing GROUP and cases(ctx).  Case names start
+# with "<GROUP>.", which is how baseline cases are matched to -g filters.
+MODULES = ("bench_source_inspection", "bench_openocd", "bench_arxml")
+
+RESULTS_VERSION = 1
+
+
+class Context:
+    """Shared settings handed to every benchmark module's ``cases()``."""
+
+    def __init__(self, workdir: Path, scale: dict, seed: int,
+                 jobs: Optional[int]) -> None:
+        self.workdir = workdir
+        self.scale = scale
+        self.seed = seed
+        self.jobs = jobs
+        self.repo = REPO_ROOT
+
+
+# ---------------------------------------------------------------------- #
+#  Measurement                                                             #
+# ---------------------------------------------------------------------- #
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """Time ``func`` and return per-call statistics in seconds.
+
+    After one warm-up call the number of calls per sample is doubled until a
+    sample takes at least ``min_time``; ``repeat`` samples are then taken.
+    """
+    func()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 16:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def selected(name: str, groups: List[str], keywords: List[str]) -> bool:
+    """Return True if case ``name`` passes the ``-g`` and ``-k`` filters."""
+    if groups and name.split(".", 1)[0] not in groups:
+        return False
+    return not keywords or any(k in name for k in keywords)
+
+
+def run(ctx: Context, groups: List[str], keywords: List[str], repeat: int,
+        min_time: float) -> Dict[str, dict]:
+    results: Dict[str, dict] = {}
+    for module_name in MODULES:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        if groups and module.GROUP not in groups:
+            continue
+        start = time.perf_counter()
+        cases = module.cases(ctx)
+        print(f"[{module.GROUP}] preparing workload ...", flush=True)
+        for name, func in cases:
+            if not selected(name, groups, keywords):
+                continue
+            stats = measure(func, repeat, min_time)
+            results[name] = stats
+            print(f"  {name:<55} {_fmt(stats['median'])}", flush=True)
+        print(f"[{module.GROUP}] done in {time.perf_counter() - start:.1f}s", flush=True)
+    return results
+
+
+# ---------------------------------------------------------------------- #
+#  Reporting                                                               #
+# ---------------------------------------------------------------------- #
+
+def _fmt(seconds: float) -> str:
+    for unit, factor in (("s", 1.0), ("ms", 1e3), ("us", 1e6)):
+        if seconds * factor >= 1.0:
+            return f"{seconds * factor:9.3f} {unit}"
+    return f"{seconds * 1e9:9.1f} ns"
+
+
+def compare(current: dict, baseline: dict, threshold: float, groups: List[str],
+            keywords: List[str]) -> Tuple[List[str], List[str]]:
+    """Print a comparison table and return ``(regressed, missing)`` case names.
+
+    Baseline cases excluded by ``groups`` / ``keywords`` are skipped; any
+    other baseline case without a current result is reported as missing.
+    """
+    base = baseline["results"]
+    cur = current["results"]
+    regressions = []
+    missing = []
+    print(f"\n{'case':<55} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name in sorted(set(cur) | {n for n in base if selected(n, groups, keywords)}):
+        if name not in cur:
+            print(f"{name:<55} {_fmt(base[name]['median'])} {'-':>12}   (missing)")
+            missing.append(name)
+            continue
+        if name not in base:
+            print(f"{name:<55} {'-':>12} {_fmt(cur[name]['median'])}   (new)")
+            continue
+        ratio = cur[name]["median"] / base[name]["median"]
+        if ratio > 1.0 + threshold:
+            verdict = "SLOWER"
+            regressions.append(name)
+        elif ratio < 1.0 - threshold:
+            verdict = "faster"
+        else:
+            verdict = ""
+        print(f"{name:<55} {_fmt(base[name]['median'])} {_fmt(cur[name]['median'])} "
+              f"{ratio:6.2f}x {verdict}")
+    if baseline.get("meta", {}).get("scale") != current["meta"]["scale"]:
+        print("\nWARNING: baseline was recorded at a different scale; "
+              "ratios are not comparable.")
+    return regressions, missing
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the offline benchmark suite for the Python tooling.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="full",
+                        help="workload size (default: full)")
+    parser.add_argument("-g", "--group", action="append", default=[],
+                        help="only run this group (sil, openocd, arxml); repeatable")
+    parser.add_argument("-k", "--keyword", action="append", default=[],
+                        help="only run cases whose name contains this text; repeatable")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timed samples per case (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per sample (default: 0.05)")
+    parser.add_argument("--seed", type=int, default=1,
+                        help="workload generator seed (default: 1)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes for parallel cases (default: one per CPU)")
+    parser.add_argument("-o", "--output", default=str(REPO_ROOT / "benchmarks" / "results" / "latest.json"),
+                        help="results JSON file (default: benchmarks/results/latest.json)")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare against a previous results JSON file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default: 0.10)")
+    parser.add_argument("--workdir",
+                        help="directory for generated workloads (default: a temp dir, removed afterwards)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+
+    if args.workdir:
+        workdir = Path(args.workdir)
+        workdir.mkdir(parents=True, exist_ok=True)
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix="vmodel-bench-"))
+    try:
+        ctx = Context(workdir, SCALES[args.scale], args.seed, args.jobs)
+        results = run(ctx, args.group, args.keyword, args.repeat, args.min_time)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    current = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "scale": args.scale,
+            "scale_params": SCALES[args.scale],
+            "seed": args.seed,
+            "jobs": args.jobs,
+        },
+        "results": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {output}")
+
+    if baseline is not None:
+        regressions, missing = compare(current, baseline, args.threshold,
+                                       args.group, args.keyword)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}.")
+        if missing:
+            print(f"\n{len(missing)} baseline case(s) did not run.")
+        if regressions or missing:
+            return 1
+    return 0
@@ -0,0 +1,96 @@
+"""Sphinx extension rendering the requirement <-> Robot test traceability matrix.
+
+Adds the ``traceability-matrix`` directive, backed by ``scripts/traceability.py``::
+
+    .. traceability-matrix::
+
+One row is emitted per requirement with its implementation and approval
+status (the ``:Implementation:`` and ``:Status:`` fields), its documented
+test cases (the ``:Test Cases:`` field), the Robot tests that tag it, and its
+coverage.  Sources are parsed incrementally through the traceability cache and
+registered as dependencies, so editing a ``.robot`` suite triggers a rebuild
+of the page.
+
+Configuration (``conf.py``)::
+
+    traceability_docs_dirs  = ["."]                       # relative to conf.py
+    traceability_robot_dirs = ["../tests/suites"]
+"""
+
+from pathlib import Path
+
+from docutils import nodes
+from docutils.statemachine import StringList
+from sphinx.util import logging
+from sphinx.util.docutils import SphinxDirective
+
+from traceability import collect_sources, load_index
+
+logger = logging.getLogger(__name__)
+
+
+def _refs(ids, known):
+    return ", ".join(f":ref:`{i} <{i}>`" if i in known else f"``{i}``" for i in ids) or "–"
+
+
+class TraceabilityMatrixDirective(SphinxDirective):
+    """Render the traceability matrix as a ``list-table``."""
+
+    has_content = False
+
+    def run(self):
+        config = self.env.config
+        confdir = Path(self.env.srcdir)
+        docs_dirs = [confdir / d for d in config.traceability_docs_dirs]
+        robot_dirs = [confdir / d for d in config.traceability_robot_dirs]
+
+        for source in collect_sources(docs_dirs, robot_dirs):
+            self.env.note_dependency(str(source))
+        index = load_index(docs_dirs, robot_dirs)
+
+        for req_id in index.uncovered():
+            logger.warning("requirement %s has no linked Robot test", req_id,
+                           location=(self.env.docname, self.lineno))
+        for item in index.invalid_ids:
+            logger.warning("malformed requirement ID %s at %s", item["id"], item["source"],
+                           location=(self.env.docname, self.lineno))
+
+        # Requirement IDs come from ``.. _REQ-...:`` labels, and test IDs listed
+        # in a ``:Test Cases:`` field are already :ref: targets in the docs;
+        # anything else is shown as a literal rather than a broken reference.
+        known = set(index.requirements) | set(index.documented_in)
+        lines = [
+            ".. list-table::",
+            "   :widths: 12 20 20 15 15 9 9",
+            "   :header-rows: 1",
+            "",
+            "   * - Req ID",
+            "     - Title",
+            "     - Implementation",
+            "     - Documented Test Cases",
+            "     - Tagged Robot Tests",
+            "     - Status",
+            "     - Coverage",
+        ]
+        for row in index.matrix():
+            lines += [
+                f"   * - :ref:`{row['req']} <{row['req']}>`",
+                f"     - {row['title'] or '–'}",
+                f"     - {row['implementation'] or '–'}",
+                f"     - {_refs(row['documented'], known)}",
+                f"     - {_refs(row['tagged'], known)}",
+                f"     - {row['status'] or '–'}",
+                f"     - {'Covered' if row['covered'] else '**Uncovered**'}",
+            ]
+
+        container = nodes.container()
+        self.state.nested_parse(StringList(lines, source="<traceability-matrix>"),
+                                self.content_offset, container)
+        return container.children
+
+
+def setup(app):
+    app.add_config_value("traceability_docs_dirs", ["."], "env")
+    app.add_config_value("traceability_robot_dirs", ["../tests/suites"], "env")
+    app.add_directive("traceability-matrix", TraceabilityMatrixDirective)
+    return {"version": "1.0", "parallel_read_safe": True, "parallel_write_safe": True}
@@ -1,5 +1,12 @@
 """Sphinx configuration for TRAVEO II Entry Family Starter Kit documentation."""
 
+import os
+import sys
+
+# Local extensions and the shared traceability engine in scripts/
+sys.path.insert(0, os.path.abspath("_ext"))
+sys.path.insert(0, os.path.abspath(os.path.join("..", "scripts")))
+
 project = "TRAVEO II Entry Family Starter Kit"
 author = "Infineon Technologies / Cypress Semiconductor"
 release = "002-25314 Rev. *B"
@@ -8,8 +15,12 @@ language = "en"
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx_rtd_theme",
+    "traceability_matrix",
 ]
 
+traceability_docs_dirs = ["."]
+traceability_robot_dirs = ["../tests/suites"]
+
 html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
 
@@ -1,26 +1,60 @@
+import argparse
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
-xml_path = Path(__file__).with_name("example.arxml")
-try:
-    tree = ET.parse(xml_path)
-except ET.ParseError as exc:
-    raise SystemExit(f"Invalid XML in {xml_path}: {exc}")
+from arxml_model import DEFAULT_CACHE_DIR, load_project
 
-root = tree.getroot()
-ns = {"ar": "http://autosar.org/schema/r4.0"}
-swcs = root.findall(".//ar:APPLICATION-SOFTWARE-COMPONENT-TYPE", ns)
+PORT_LABELS = {"provided": "P-Port", "required": "R-Port", "provided-required": "PR-Port"}
 
-for swc in swcs:
-    name = swc.findtext("ar:SHORT-NAME", default="<unnamed>", namespaces=ns)
-    print(f"\nSWC: {name}")
 
-    for port in swc.findall(".//ar:P-PORT-PROTOTYPE", ns):
-        port_name = port.findtext("ar:SHORT-NAME", default="<unnamed>", namespaces=ns)
-        print("  P-Port:", port_name)
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print the SWCs, ports and resolved interfaces of ARXML files.")
+    parser.add_argument("sources", nargs="*", default=[str(Path(__file__).with_name("example.arxml"))],
+                        help="ARXML files, directories or glob patterns (default: example.arxml)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="parser processes (default: one per CPU)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="directory for the parsed-fragment and model cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="reparse every file; do not read or write the cache")
+    args = parser.parse_args(argv)
 
-    for port in swc.findall(".//ar:R-PORT-PROTOTYPE", ns):
-        port_name = port.findtext("ar:SHORT-NAME", default="<unnamed>", namespaces=ns)
-        print("  R-Port:", port_name)
+    try:
+        model = load_project(args.sources, cache_dir=args.cache_dir,
+                             use_cache=not args.no_cache, jobs=args.jobs)
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc))
+    except ET.ParseError as exc:
+        raise SystemExit(f"Invalid XML in {exc.filename}: {exc}")
 
-print(f"\nTotal SWC: {len(swcs)}")
+    for swc_path, swc in model.swcs.items():
+        print(f"\nSWC: {swc_path.rsplit('/', 1)[-1]}")
+
+        for port in swc["ports"]:
+            label = PORT_LABELS[port["direction"]]
+            if port["target"] is None:
+                print(f"  {label}: {port['name']} -> <unresolved: {port['tref']}>")
+                continue
+            if port["interface"] is None:
+                print(f"  {label}: {port['name']} -> {port['target']} ({port['target_kind']})")
+                continue
+            elements = model.interfaces[port["interface"]]["data_elements"]
+            names = ", ".join(e["name"] for e in elements)
+            print(f"  {label}: {port['name']} -> {port['interface']} [{names}]")
+
+    print(f"\nTotal SWC: {len(model.swcs)} (from {len(model.sources)} file(s))")
+
+    for entry in model.conflicts:
+        first, other = entry["files"]
+        print(f"{entry['kind'].upper()}: {entry['path']} defined in {first} and {other}",
+              file=sys.stderr)
+
+    return 1 if any(entry["kind"] == "conflict" for entry in model.conflicts) else 0
+
+
+# The guard keeps ProcessPoolExecutor workers started with the "spawn"
+# method (the default on Windows and macOS) from rerunning the script.
+if __name__ == "__main__":
+    sys.exit(main())
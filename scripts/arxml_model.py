@@ -0,0 +1,624 @@
+"""
+arxml_model.py
+==============
+Resolved in-memory index of an AUTOSAR ARXML description, optionally spread
+over many files.
+
+Parses software-component types, their ports and the sender/receiver
+interfaces referenced by ``PROVIDED-INTERFACE-TREF`` /
+``REQUIRED-INTERFACE-TREF``, and resolves every reference to the
+``SENDER-RECEIVER-INTERFACE`` and ``VARIABLE-DATA-PROTOTYPE`` definitions in
+the same model.  The result is an index::
+
+    SWC -> ports -> interface -> data elements
+
+plus reverse maps (interface -> ports, data element -> interfaces) so that
+questions such as "which SWCs exchange ``VehicleSpeed``" are dictionary
+lookups instead of XML scans.
+
+Multi-file projects are loaded with `load_project`, which accepts files,
+directories and glob patterns.  Each file is parsed into a fragment in a
+process pool, the fragments are merged into one package namespace, and
+elements defined at the same SHORT-NAME path in more than one file are
+reported as ``duplicate`` (identical definitions) or ``conflict``
+(differing definitions; the first file in sorted order wins).
+
+Two caches, both compact JSON keyed by SHA-256, live in the cache directory:
+
+- ``fragments/<file digest>.json`` – the parsed fragment of one file, so a
+  rerun reparses only files whose content changed;
+- ``project-<digest>.json`` – the merged, resolved index for an exact set of
+  files, so repeated queries skip parsing and merging entirely.
+
+A small manifest per file list, ``projects/<list digest>.json``, names that
+list's current project index and file digests.  When a file changes, the
+index it replaces is removed, along with fragments that no manifest still
+references; only the `MAX_CACHED_PROJECTS` most recently used file lists are
+kept, so several projects can share one cache directory.
+
+Usage
+-----
+From Python::
+
+    from arxml_model import load_model, load_project
+
+    model = load_model("scripts/example.arxml")
+    model.exchanges("VehicleSpeed")
+
+    model = load_project(["arxml/", "extra/**/*.arxml"], jobs=8)
+    model.conflicts
+
+From the command line, see ``arxml_query.py``.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Bump whenever the cached fragment or index layout changes.
+CACHE_VERSION = 4
+
+DEFAULT_CACHE_DIR = Path(__file__).with_name(".arxml_cache")
+
+# Distinct file lists whose indexes and fragments the cache keeps.
+MAX_CACHED_PROJECTS = 16
+
+SWC_TAGS = (
+    "APPLICATION-SOFTWARE-COMPONENT-TYPE",
+    "SENSOR-ACTUATOR-SW-COMPONENT-TYPE",
+    "COMPLEX-DEVICE-DRIVER-SW-COMPONENT-TYPE",
+    "ECU-ABSTRACTION-SW-COMPONENT-TYPE",
+    "SERVICE-SW-COMPONENT-TYPE",
+    "COMPOSITION-SW-COMPONENT-TYPE",
+)
+
+# Port prototype tag -> (direction, interface reference tag)
+PORT_TAGS = {
+    "P-PORT-PROTOTYPE": ("provided", "PROVIDED-INTERFACE-TREF"),
+    "R-PORT-PROTOTYPE": ("required", "REQUIRED-INTERFACE-TREF"),
+    "PR-PORT-PROTOTYPE": ("provided-required", "PROVIDED-REQUIRED-INTERFACE-TREF"),
+}
+
+INTERFACE_TAG = "SENDER-RECEIVER-INTERFACE"
+
+# Every element type a port prototype may be typed by.  Only sender/receiver
+# interfaces are indexed; ports typed by the others resolve to their target
+# but carry no data elements.
+PORT_INTERFACE_TAGS = (
+    INTERFACE_TAG,
+    "CLIENT-SERVER-INTERFACE",
+    "MODE-SWITCH-INTERFACE",
+    "PARAMETER-INTERFACE",
+    "NV-DATA-INTERFACE",
+    "TRIGGER-INTERFACE",
+)
+
+
+# ---------------------------------------------------------------------- #
+#  Parsing                                                                 #
+# ---------------------------------------------------------------------- #
+
+def _local(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix from an ElementTree tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child(elem: ET.Element, name: str) -> Optional[ET.Element]:
+    for child in elem:
+        if _local(child.tag) == name:
+            return child
+    return None
+
+
+def _children(elem: ET.Element, name: str) -> List[ET.Element]:
+    return [child for child in elem if _local(child.tag) == name]
+
+
+def _short_name(elem: ET.Element) -> Optional[str]:
+    node = _child(elem, "SHORT-NAME")
+    if node is None or not (node.text or "").strip():
+        return None
+    return node.text.strip()
+
+
+def _parse_swc(elem: ET.Element) -> dict:
+    ports = []
+    ports_node = _child(elem, "PORTS")
+    if ports_node is not None:
+        for port in ports_node:
+            tag = _local(port.tag)
+            if tag not in PORT_TAGS:
+                continue
+            direction, tref_tag = PORT_TAGS[tag]
+            tref = _child(port, tref_tag)
+            ports.append({
+                "name": _short_name(port) or "<unnamed>",
+                "direction": direction,
+                "tref": (tref.text or "").strip() if tref is not None else None,
+            })
+    return {"kind": _local(elem.tag), "ports": ports}
+
+
+def _parse_interface(elem: ET.Element) -> dict:
+    data_elements = []
+    container = _child(elem, "DATA-ELEMENTS")
+    if container is not None:
+        for proto in _children(container, "VARIABLE-DATA-PROTOTYPE"):
+            type_tref = _child(proto, "TYPE-TREF")
+            data_elements.append({
+                "name": _short_name(proto) or "<unnamed>",
+                "type": (type_tref.text or "").strip() if type_tref is not None else None,
+            })
+    return {"data_elements": data_elements}
+
+
+def _element_digest(elem: ET.Element) -> str:
+    """SHA-256 of ``elem`` in canonical XML (C14N 2.0, whitespace-only text
+    dropped), so formatting and attribute order do not count as changes."""
+    canonical = ET.canonicalize(ET.tostring(elem, encoding="unicode"), strip_text=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def parse_arxml(path) -> dict:
+    """Parse one ARXML file into an unresolved fragment.
+
+    The fragment maps absolute SHORT-NAME paths (``/Pkg/Element``) to the
+    raw SWC and interface definitions found in the file.  Interface
+    references are kept verbatim; they are resolved by `build_model`.
+    ``digests`` holds a SHA-256 of every element's canonical XML, which
+    `merge_fragments` uses to tell duplicates from conflicts.
+
+    Raises ``xml.etree.ElementTree.ParseError`` on malformed XML.
+    """
+    root = ET.parse(path).getroot()
+    fragment = {"elements": {}, "digests": {}, "swcs": {}, "interfaces": {}}
+
+    def walk(packages: ET.Element, prefix: str) -> None:
+        for pkg in _children(packages, "AR-PACKAGE"):
+            pkg_path = f"{prefix}/{_short_name(pkg) or '<unnamed>'}"
+            elements = _child(pkg, "ELEMENTS")
+            if elements is not None:
+                for elem in elements:
+                    name = _short_name(elem)
+                    if name is None:
+                        continue
+                    tag = _local(elem.tag)
+                    elem_path = f"{pkg_path}/{name}"
+                    fragment["elements"][elem_path] = tag
+                    fragment["digests"][elem_path] = _element_digest(elem)
+                    if tag in SWC_TAGS:
+                        fragment["swcs"][elem_path] = _parse_swc(elem)
+                    elif tag == INTERFACE_TAG:
+                        fragment["interfaces"][elem_path] = _parse_interface(elem)
+            sub = _child(pkg, "AR-PACKAGES")
+            if sub is not None:
+                walk(sub, pkg_path)
+
+    top = _child(root, "AR-PACKAGES")
+    if top is not None:
+        walk(top, "")
+    return fragment
+
+
+# ---------------------------------------------------------------------- #
+#  Model                                                                   #
+# ---------------------------------------------------------------------- #
+
+def _basename(path: str) -> str:
+    return path.rsplit("/", 1)[-1]
+
+
+def _package_of(path: str) -> str:
+    return path.rsplit("/", 1)[0]
+
+
+class ArxmlModel:
+    """Resolved SWC / port / interface / data-element index.
+
+    All element keys are absolute SHORT-NAME paths.  Query methods also
+    accept bare short names and return every element that matches.
+    """
+
+    def __init__(self) -> None:
+        # swc path -> {"kind", "ports": [{"name", "direction", "tref", "target",
+        #                                 "target_kind", "interface"}]}
+        # "target" is the resolved element path (None if it does not exist),
+        # "interface" the same path only when it is a sender/receiver interface.
+        self.swcs: Dict[str, dict] = {}
+        # interface path -> {"data_elements": [{"name", "type"}]}
+        self.interfaces: Dict[str, dict] = {}
+        # interface path -> [[swc path, port name, direction], ...]
+        self.interface_ports: Dict[str, List[list]] = {}
+        # data element short name -> [interface path, ...]
+        self.data_element_interfaces: Dict[str, List[str]] = {}
+        # [[swc path, port name, tref], ...] for references to missing elements
+        self.unresolved: List[list] = []
+        # [[swc path, port name, target path, target tag], ...] for references
+        # that resolve to an element other than a sender/receiver interface
+        self.non_sr_ports: List[list] = []
+        # [{"path", "kind": "duplicate" | "conflict", "files": [first, other]}, ...]
+        self.conflicts: List[dict] = []
+        # ARXML file -> SHA-256 digest of the files the model was built from
+        self.sources: Dict[str, str] = {}
+
+    # -------------------------------------------------------------- #
+    #  Serialisation                                                   #
+    # -------------------------------------------------------------- #
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CACHE_VERSION,
+            "swcs": self.swcs,
+            "interfaces": self.interfaces,
+            "interface_ports": self.interface_ports,
+            "data_element_interfaces": self.data_element_interfaces,
+            "unresolved": self.unresolved,
+            "non_sr_ports": self.non_sr_ports,
+            "conflicts": self.conflicts,
+            "sources": self.sources,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ArxmlModel":
+        if data.get("version") != CACHE_VERSION:
+            raise ValueError(
+                f"Unsupported model cache version {data.get('version')!r} "
+                f"(expected {CACHE_VERSION})"
+            )
+        model = cls()
+        model.swcs = data["swcs"]
+        model.interfaces = data["interfaces"]
+        model.interface_ports = data["interface_ports"]
+        model.data_element_interfaces = data["data_element_interfaces"]
+        model.unresolved = data["unresolved"]
+        model.non_sr_ports = data["non_sr_ports"]
+        model.conflicts = data["conflicts"]
+        model.sources = data["sources"]
+        return model
+
+    # -------------------------------------------------------------- #
+    #  Queries                                                         #
+    # -------------------------------------------------------------- #
+
+    def _match(self, table: Dict[str, dict], name: str) -> List[str]:
+        if name in table:
+            return [name]
+        return [path for path in table if _basename(path) == name]
+
+    def find_swcs(self, name: str) -> List[str]:
+        """Return the paths of all SWCs whose path or short name is ``name``."""
+        return self._match(self.swcs, name)
+
+    def find_interfaces(self, name: str) -> List[str]:
+        """Return the paths of all interfaces whose path or short name is ``name``."""
+        return self._match(self.interfaces, name)
+
+    def ports_of(self, swc: str) -> List[dict]:
+        """Return the resolved ports of ``swc`` (path or short name)."""
+        return [
+            dict(port, swc=path)
+            for path in self.find_swcs(swc)
+            for port in self.swcs[path]["ports"]
+        ]
+
+    def data_elements_of(self, interface: str) -> List[dict]:
+        """Return the data elements of ``interface`` (path or short name)."""
+        return [
+            dict(element, interface=path)
+            for path in self.find_interfaces(interface)
+            for element in self.interfaces[path]["data_elements"]
+        ]
+
+    def ports_using(self, interface: str) -> List[list]:
+        """Return ``[swc, port, direction]`` for every port typed by ``interface``."""
+        return [
+            entry
+            for path in self.find_interfaces(interface)
+            for entry in self.interface_ports.get(path, [])
+        ]
+
+    def exchanges(self, data_element: str) -> Dict[str, List[list]]:
+        """Return which SWC ports provide and require ``data_element``.
+
+        ``data_element`` is either a bare short name (``VehicleSpeed``) or a
+        qualified ``/Pkg/Interface/Element`` path.
+
+        Returns ``{"provided": [[swc, port, interface], ...],
+        "required": [...]}``; ``provided-required`` ports appear in both.
+        """
+        if "/" in data_element.strip("/"):
+            interface, name = data_element.rsplit("/", 1)
+            interfaces = [i for i in self.find_interfaces(interface)
+                          if i in self.data_element_interfaces.get(name, [])]
+        else:
+            interfaces = self.data_element_interfaces.get(data_element, [])
+        result = {"provided": [], "required": []}
+        for interface in interfaces:
+            for swc, port, direction in self.interface_ports.get(interface, []):
+                for side in ("provided", "required"):
+                    if side in direction:
+                        result[side].append([swc, port, interface])
+        return result
+
+
+def _resolve(tref: str, package: str, elements: Dict[str, str],
+             by_name: Dict[str, List[str]], kinds: Iterable[str]) -> Optional[str]:
+    """Resolve ``tref`` to the absolute path of an element whose type is in ``kinds``.
+
+    Absolute references are looked up directly.  Relative references are
+    tried against the referencing package and each of its parents, then
+    against a unique short-name match anywhere in the model.
+    """
+    if tref.startswith("/"):
+        return tref if elements.get(tref) in kinds else None
+    pkg = package
+    while pkg:
+        candidate = f"{pkg}/{tref}"
+        if elements.get(candidate) in kinds:
+            return candidate
+        pkg = _package_of(pkg)
+    matches = [p for p in by_name.get(_basename(tref), []) if elements[p] in kinds]
+    return matches[0] if len(matches) == 1 else None
+
+
+def build_model(fragment: dict) -> ArxmlModel:
+    """Resolve the interface references of a parsed fragment into an `ArxmlModel`."""
+    elements = fragment["elements"]
+    by_name: Dict[str, List[str]] = {}
+    for path in elements:
+        by_name.setdefault(_basename(path), []).append(path)
+
+    model = ArxmlModel()
+    for path, interface in fragment["interfaces"].items():
+        model.interfaces[path] = interface
+        model.interface_ports[path] = []
+        for element in interface["data_elements"]:
+            model.data_element_interfaces.setdefault(element["name"], []).append(path)
+
+    for path, swc in fragment["swcs"].items():
+        ports = []
+        for port in swc["ports"]:
+            target = None
+            if port["tref"]:
+                target = _resolve(port["tref"], _package_of(path), elements,
+                                  by_name, PORT_INTERFACE_TAGS)
+            kind = elements[target] if target else None
+            if target is None:
+                model.unresolved.append([path, port["name"], port["tref"]])
+            elif kind == INTERFACE_TAG:
+                model.interface_ports[target].append(
+                    [path, port["name"], port["direction"]]
+                )
+            else:
+                model.non_sr_ports.append([path, port["name"], target, kind])
+            ports.append(dict(port, target=target, target_kind=kind,
+                              interface=target if kind == INTERFACE_TAG else None))
+        model.swcs[path] = {"kind": swc["kind"], "ports": ports}
+    return model
+
+
+# ---------------------------------------------------------------------- #
+#  Multi-file merge                                                        #
+# ---------------------------------------------------------------------- #
+
+def collect_arxml_files(sources: Iterable) -> List[Path]:
+    """Expand files, directories (recursive ``*.arxml``) and glob patterns.
+
+    Returns a sorted, de-duplicated list.  Raises ``FileNotFoundError`` if a
+    source matches nothing.
+    """
+    files = set()
+    for source in sources:
+        source = str(source)
+        path = Path(source)
+        if path.is_dir():
+            matches = [p for p in path.rglob("*.arxml") if p.is_file()]
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = [Path(p) for p in glob.glob(source, recursive=True)
+                       if os.path.isfile(p)]
+        if not matches:
+            raise FileNotFoundError(f"No ARXML files found for {source!r}")
+        files.update(p.resolve() for p in matches)
+    return sorted(files)
+
+
+def merge_fragments(fragments: Iterable[Tuple[str, dict]]) -> Tuple[dict, List[dict]]:
+    """Merge per-file fragments into one package namespace.
+
+    ``fragments`` is an ordered sequence of ``(file, fragment)`` pairs.  The
+    first definition of a SHORT-NAME path wins; every later definition at the
+    same path is recorded as a ``duplicate`` when its canonical XML is
+    identical (same content digest) or as a ``conflict`` otherwise.
+
+    Returns ``(merged fragment, conflicts)``.
+    """
+    merged = {"elements": {}, "digests": {}, "swcs": {}, "interfaces": {}}
+    origin: Dict[str, str] = {}
+    conflicts: List[dict] = []
+    for file, fragment in fragments:
+        for path, tag in fragment["elements"].items():
+            if path not in origin:
+                origin[path] = file
+                merged["elements"][path] = tag
+                merged["digests"][path] = fragment["digests"][path]
+                for table in ("swcs", "interfaces"):
+                    if path in fragment[table]:
+                        merged[table][path] = fragment[table][path]
+                continue
+            same = merged["digests"][path] == fragment["digests"][path]
+            conflicts.append({
+                "path": path,
+                "kind": "duplicate" if same else "conflict",
+                "files": [origin[path], file],
+            })
+    return merged, conflicts
+
+
+def _parse_worker(path: str) -> Tuple[str, Optional[dict], Optional[str]]:
+    """Process-pool entry point: parse one file, returning errors as text."""
+    try:
+        return path, parse_arxml(path), None
+    except ET.ParseError as exc:
+        return path, None, str(exc)
+
+
+def _parse_files(paths: List[str], jobs: Optional[int]) -> Dict[str, dict]:
+    """Parse ``paths`` (in a process pool when more than one) into fragments.
+
+    Raises ``ET.ParseError`` with ``filename`` set for the first bad file.
+    """
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        results = [_parse_worker(path) for path in paths]
+    else:
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_parse_worker, paths, chunksize=chunksize))
+
+    fragments = {}
+    for path, fragment, error in results:
+        if error is not None:
+            exc = ET.ParseError(error)
+            exc.filename = path
+            raise exc
+        fragments[path] = fragment
+    return fragments
+
+
+# ---------------------------------------------------------------------- #
+#  Cache                                                                   #
+# ---------------------------------------------------------------------- #
+
+def file_digest(path) -> str:
+    """Return the SHA-256 hex digest of the file at ``path``."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _prune_cache(cache_dir: Path, max_projects: int) -> None:
+    """Drop cache entries that no current file set can reach.
+
+    Keeps the ``max_projects`` most recently used manifests, deletes project
+    indexes that no kept manifest names (replaced by a newer index for the
+    same file list, evicted, or left over from an older layout) and deletes
+    fragments that no kept manifest references.
+    """
+    manifests = sorted((cache_dir / "projects").glob("*.json"),
+                       key=lambda p: p.stat().st_mtime, reverse=True)
+    stale = manifests[max_projects:]
+    keep_projects = set()
+    keep_fragments = set()
+    for path in manifests[:max_projects]:
+        manifest = _read_json(path)
+        if manifest is None:
+            stale.append(path)
+            continue
+        keep_projects.add(f"project-{manifest['key']}.json")
+        keep_fragments.update(f"{digest}.json" for digest in manifest["digests"])
+    stale += [p for p in cache_dir.glob("project-*.json") if p.name not in keep_projects]
+    stale += [p for p in (cache_dir / "fragments").glob("*.json")
+              if p.name not in keep_fragments]
+    for path in stale:
+        try:
+            path.unlink()
+        except OSError:
+            pass  # removed concurrently or not ours to delete
+
+
+def load_project(sources: Iterable, cache_dir=DEFAULT_CACHE_DIR,
+                 use_cache: bool = True, jobs: Optional[int] = None) -> ArxmlModel:
+    """Return the merged, resolved model for all ARXML files in ``sources``.
+
+    ``sources`` may mix files, directories and glob patterns (see
+    `collect_arxml_files`).  Files whose digest has a cached fragment are not
+    reparsed; the rest are parsed with up to ``jobs`` worker processes
+    (default: one per CPU).  Pass ``use_cache=False`` to reparse everything
+    without reading or writing the cache.  Writing a new project index
+    prunes entries no longer reachable from a cached file set (see
+    `_prune_cache`).
+
+    Raises ``FileNotFoundError`` for a source that matches nothing and
+    ``ET.ParseError`` (with ``filename`` set) for malformed XML.
+    """
+    files = [str(p) for p in collect_arxml_files(sources)]
+    digests = {f: file_digest(f) for f in files}
+
+    if not use_cache:
+        fragments = _parse_files(files, jobs)
+    else:
+        cache_dir = Path(cache_dir)
+        list_key = hashlib.sha256("".join(f"{f}\n" for f in files).encode("utf-8")).hexdigest()
+        key = hashlib.sha256(
+            "".join(f"{f}\0{digests[f]}\n" for f in files).encode("utf-8")
+        ).hexdigest()
+        manifest_file = cache_dir / "projects" / f"{list_key}.json"
+        project_file = cache_dir / f"project-{key}.json"
+        cached = _read_json(project_file)
+        if cached is not None:
+            try:
+                model = ArxmlModel.from_dict(cached)
+            except (KeyError, ValueError):
+                pass  # stale layout: rebuild below
+            else:
+                try:
+                    os.utime(manifest_file)  # mark as recently used
+                except OSError:
+                    pass
+                return model
+
+        fragments = {}
+        for f in files:
+            entry = _read_json(cache_dir / "fragments" / f"{digests[f]}.json")
+            if entry is not None and entry.get("version") == CACHE_VERSION:
+                fragments[f] = entry["fragment"]
+        changed = [f for f in files if f not in fragments]
+        if changed:
+            for f, fragment in _parse_files(changed, jobs).items():
+                fragments[f] = fragment
+                _write_json(cache_dir / "fragments" / f"{digests[f]}.json",
+                            {"version": CACHE_VERSION, "fragment": fragment})
+
+    merged, conflicts = merge_fragments((f, fragments[f]) for f in files)
+    model = build_model(merged)
+    model.conflicts = conflicts
+    model.sources = digests
+    if use_cache:
+        _write_json(project_file, model.to_dict())
+        _write_json(manifest_file, {"key": key, "digests": sorted(set(digests.values()))})
+        _prune_cache(cache_dir, MAX_CACHED_PROJECTS)
+    return model
+
+
+def load_model(arxml_path, cache_dir=DEFAULT_CACHE_DIR,
+               use_cache: bool = True) -> ArxmlModel:
+    """Return the resolved model for the single file ``arxml_path``.
+
+    Shorthand for ``load_project([arxml_path])``; a changed file never hits
+    a stale cache entry because every entry is keyed by content digest.
+    """
+    return load_project([arxml_path], cache_dir=cache_dir, use_cache=use_cache, jobs=1)
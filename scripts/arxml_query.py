@@ -0,0 +1,148 @@
+"""
+arxml_query.py
+==============
+Command-line queries against the resolved ARXML index built by
+``arxml_model.py``.  The index is cached per file hash, so only the first
+query after an ARXML change pays for XML parsing.  ``--arxml`` may be given
+several times and accepts files, directories and glob patterns; all matched
+files are merged into one model.
+
+Usage
+-----
+::
+
+    python scripts/arxml_query.py swcs
+    python scripts/arxml_query.py ports SpeedController
+    python scripts/arxml_query.py interface SpeedInterface
+    python scripts/arxml_query.py exchange VehicleSpeed
+    python scripts/arxml_query.py unresolved
+    python scripts/arxml_query.py non-sr
+    python scripts/arxml_query.py --arxml arxml/ --arxml "ecu/**/*.arxml" conflicts
+
+    python scripts/arxml_query.py --arxml path/to/model.arxml --no-cache swcs
+"""
+
+import argparse
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from arxml_model import DEFAULT_CACHE_DIR, load_project
+
+
+def _cmd_swcs(model, args) -> int:
+    for path, swc in sorted(model.swcs.items()):
+        print(f"{path}  ({swc['kind']}, {len(swc['ports'])} ports)")
+    return 0
+
+
+def _cmd_ports(model, args) -> int:
+    ports = model.ports_of(args.swc)
+    if not ports:
+        print(f"No SWC named {args.swc!r}", file=sys.stderr)
+        return 1
+    for port in ports:
+        if port["target"] is None:
+            interface = f"<unresolved: {port['tref']}>"
+        elif port["interface"] is None:
+            interface = f"{port['target']} ({port['target_kind']})"
+        else:
+            interface = port["interface"]
+        print(f"{port['swc']}  {port['direction']:<17} {port['name']:<20} {interface}")
+    return 0
+
+
+def _cmd_interface(model, args) -> int:
+    paths = model.find_interfaces(args.interface)
+    if not paths:
+        print(f"No interface named {args.interface!r}", file=sys.stderr)
+        return 1
+    for path in paths:
+        print(path)
+        for element in model.interfaces[path]["data_elements"]:
+            print(f"  data element: {element['name']} ({element['type']})")
+        for swc, port, direction in model.interface_ports[path]:
+            print(f"  {direction:<17} {swc}.{port}")
+    return 0
+
+
+def _cmd_exchange(model, args) -> int:
+    result = model.exchanges(args.data_element)
+    if not result["provided"] and not result["required"]:
+        print(f"No SWC exchanges {args.data_element!r}", file=sys.stderr)
+        return 1
+    for side in ("provided", "required"):
+        for swc, port, interface in result[side]:
+            print(f"{side:<9} {swc}.{port}  via {interface}")
+    return 0
+
+
+def _cmd_unresolved(model, args) -> int:
+    for swc, port, tref in model.unresolved:
+        print(f"{swc}.{port}  -> {tref or '<missing TREF>'}")
+    return 1 if model.unresolved else 0
+
+
+def _cmd_non_sr(model, args) -> int:
+    for swc, port, target, kind in model.non_sr_ports:
+        print(f"{swc}.{port}  -> {target}  ({kind})")
+    return 0
+
+
+def _cmd_conflicts(model, args) -> int:
+    for entry in model.conflicts:
+        first, other = entry["files"]
+        print(f"{entry['kind']:<9} {entry['path']}  {first}  {other}")
+    return 1 if any(e["kind"] == "conflict" for e in model.conflicts) else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--arxml", action="append", default=None,
+                        help="ARXML file, directory or glob; repeatable "
+                             "(default: scripts/example.arxml)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="directory for the resolved-index cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always reparse the ARXML; do not read or write the cache")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="parser processes for uncached files (default: one per CPU)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("swcs", help="list all SWCs").set_defaults(func=_cmd_swcs)
+
+    p = sub.add_parser("ports", help="list the resolved ports of an SWC")
+    p.add_argument("swc")
+    p.set_defaults(func=_cmd_ports)
+
+    p = sub.add_parser("interface", help="show data elements and users of an interface")
+    p.add_argument("interface")
+    p.set_defaults(func=_cmd_interface)
+
+    p = sub.add_parser("exchange", help="list SWC ports providing / requiring a data element")
+    p.add_argument("data_element")
+    p.set_defaults(func=_cmd_exchange)
+
+    sub.add_parser("unresolved", help="list ports whose interface TREF names no element") \
+        .set_defaults(func=_cmd_unresolved)
+
+    sub.add_parser("non-sr", help="list ports typed by a non-sender/receiver interface") \
+        .set_defaults(func=_cmd_non_sr)
+
+    sub.add_parser("conflicts", help="list SHORT-NAME paths defined in more than one file") \
+        .set_defaults(func=_cmd_conflicts)
+
+    args = parser.parse_args(argv)
+    sources = args.arxml or [str(Path(__file__).with_name("example.arxml"))]
+    try:
+        model = load_project(sources, cache_dir=args.cache_dir,
+                             use_cache=not args.no_cache, jobs=args.jobs)
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc))
+    except ET.ParseError as exc:
+        raise SystemExit(f"Invalid XML in {exc.filename}: {exc}")
+    return args.func(model, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
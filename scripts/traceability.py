@@ -0,0 +1,498 @@
+"""
+traceability.py
+===============
+Bidirectional requirement <-> test traceability index.
+
+Requirement-to-test links live in two places:
+
+- the ``:Test Cases:`` field of each ``.. _REQ-...:`` block in the Sphinx
+  sources (``docs/requirements.rst``);
+- the ``[Tags]`` / ``Test Tags`` of each test in the Robot suites
+  (``tests/suites/*.robot``), e.g. ``TC-004  REQ-FUNC-002``.
+
+Both sides are parsed with lightweight line scanners (no Sphinx or Robot
+import needed) into per-file fragments.  Fragments are cached in one JSON
+file keyed by each source's SHA-256, so a rerun only reparses files whose
+content changed and stays fast as the requirement set grows.
+
+A requirement is *covered* when at least one existing Robot test links to
+it from either side.  Links present on only one side are reported as
+*mismatches*; references to requirements or tests that do not exist are
+reported as *unknown*.  Both sides accept requirement IDs matching `REQ_ID`
+only; a ``REQ-...`` label or tag of any other form (e.g. ``REQ-SW-A``) is
+reported as an *invalid ID* instead of being indexed.
+
+Usage
+-----
+::
+
+    python scripts/traceability.py check              # exit 1 if uncovered
+    python scripts/traceability.py check --strict     # ... or inconsistent
+    python scripts/traceability.py matrix
+    python scripts/traceability.py show REQ-FUNC-002
+    python scripts/traceability.py show TC-011
+
+The same index backs the ``traceability-matrix`` Sphinx directive
+(``docs/_ext/traceability_matrix.py``) and ``TraceabilityLibrary.py`` in
+``tests/libraries/``.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Bump whenever the cached fragment layout changes.
+CACHE_VERSION = 4
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DOCS_DIR = REPO_ROOT / "docs"
+DEFAULT_ROBOT_DIR = REPO_ROOT / "tests" / "suites"
+DEFAULT_CACHE_DIR = Path(__file__).with_name(".traceability_cache")
+
+REQ_ID = re.compile(r"REQ-[A-Z0-9]+(?:-[A-Z0-9]+)*-\d+")
+TC_ID = re.compile(r"TC-\d+")
+
+_REQ_LABEL = re.compile(r"^\.\.\s+_(REQ-[^:\s]+):\s*$")
+_ANY_LABEL = re.compile(r"^\.\.\s+_[^:]+:\s*$")
+_FIELD = re.compile(r"^:([^:]+):\s*(.*)$")
+_TITLE = re.compile(r"^\*\*(REQ-[A-Za-z0-9-]+)\*\*\s*[–—-]\s*(.+)$")
+_SECTION = re.compile(r"^\*\*\*\s*([A-Za-z ]+?)\s*\*\*\*")
+_ROBOT_SEP = re.compile(r"\s{2,}|\t|\s+\|\s+")
+
+
+# ---------------------------------------------------------------------- #
+#  Parsing                                                                 #
+# ---------------------------------------------------------------------- #
+
+def parse_rst(text: str) -> dict:
+    """Return ``{"requirements": {REQ-ID: {...}}, "duplicates": [...]}`` for
+    one reStructuredText file.
+
+    Each requirement starts at its ``.. _REQ-...:`` label and ends at the
+    next label.  The ``:Test Cases:`` field (including indented
+    continuation lines) supplies the documented test IDs; the ``:Status:``
+    and ``:Implementation:`` fields are kept as raw reST text.  A label repeated
+    in the same file keeps its first block; the repeat is listed in
+    ``duplicates`` as ``{"id", "lines": [first, other]}``.  Labels that do
+    not match `REQ_ID` are skipped and listed in ``invalid`` as
+    ``{"id", "line"}``.
+    """
+    requirements: Dict[str, dict] = {}
+    duplicates: List[dict] = []
+    invalid: List[dict] = []
+    current: Optional[dict] = None
+    field: Optional[str] = None
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        label = _REQ_LABEL.match(line)
+        if label:
+            current = {"title": "", "line": lineno, "tests": [],
+                       "status": "", "implementation": ""}
+            req_id = label.group(1)
+            if not REQ_ID.fullmatch(req_id):
+                invalid.append({"id": req_id, "line": lineno})
+                current = field = None
+                continue
+            if req_id in requirements:
+                duplicates.append(
+                    {"id": req_id, "lines": [requirements[req_id]["line"], lineno]})
+            else:
+                requirements[req_id] = current
+            field = None
+            continue
+        if current is None:
+            continue
+        if _ANY_LABEL.match(line):
+            current = field = None
+            continue
+        m = _FIELD.match(line)
+        if m:
+            field, value = m.group(1).strip(), m.group(2)
+        elif field and line[:1].isspace() and line.strip():
+            value = line
+        else:
+            field = None
+            title = _TITLE.match(line.strip())
+            if title and not current["title"]:
+                current["title"] = title.group(2).strip()
+            continue
+        if field == "Test Cases":
+            for tc in TC_ID.findall(value):
+                if tc not in current["tests"]:
+                    current["tests"].append(tc)
+        elif field in ("Status", "Implementation"):
+            key = field.lower()
+            current[key] = f"{current[key]} {value.strip()}".strip()
+    return {"requirements": requirements, "duplicates": duplicates, "invalid": invalid}
+
+
+def parse_robot(text: str) -> dict:
+    """Return ``{"tests": {TC-ID: {...}}, "duplicates": [...]}`` for one
+    Robot Framework suite.
+
+    The test ID is the first ``TC-nnn`` tag of a test (falling back to the
+    test name); requirement IDs are all ``REQ-...`` tags, including those
+    set suite-wide with ``Test Tags`` / ``Force Tags``.  A test ID used twice
+    in the suite keeps its first test; the repeat is listed in
+    ``duplicates`` as ``{"id", "lines": [first, other]}``.  ``REQ-...`` tags
+    that do not match `REQ_ID` are listed in ``invalid`` as ``{"id", "line"}``.
+    """
+    tests: Dict[str, dict] = {}
+    duplicates: List[dict] = []
+    invalid: List[dict] = []
+    suite_tags: List[str] = []
+    section = ""
+    pending: List[dict] = []
+    current: Optional[dict] = None
+    in_tags = False
+    in_suite_tags = False
+
+    for lineno, raw in enumerate(text.splitlines(), start=1):
+        line = raw.rstrip()
+        header = _SECTION.match(line)
+        if header:
+            section = header.group(1).lower()
+            current = None
+            in_tags = in_suite_tags = False
+            continue
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        cells = [c for c in _ROBOT_SEP.split(line.strip()) if c]
+
+        if section == "settings":
+            if cells[0] in ("Test Tags", "Force Tags"):
+                suite_tags.extend(cells[1:])
+                in_suite_tags = True
+            elif cells[0] == "..." and in_suite_tags:
+                suite_tags.extend(cells[1:])
+            else:
+                in_suite_tags = False
+            continue
+
+        if section not in ("test cases", "test case", "tasks", "task"):
+            continue
+        if not raw[:1].isspace():
+            current = {"name": cells[0], "line": lineno, "tags": []}
+            pending.append(current)
+            in_tags = False
+            continue
+        if current is None:
+            continue
+        if cells[0] == "[Tags]":
+            current["tags"].extend(cells[1:])
+            in_tags = True
+        elif cells[0] == "..." and in_tags:
+            current["tags"].extend(cells[1:])
+        else:
+            in_tags = False
+
+    for test in pending:
+        tags = test["tags"] + suite_tags
+        ids = [t for t in tags if TC_ID.fullmatch(t)] or TC_ID.findall(test["name"])
+        test_id = ids[0] if ids else test["name"]
+        reqs = []
+        for tag in tags:
+            if not tag.startswith("REQ-"):
+                continue
+            if not REQ_ID.fullmatch(tag):
+                invalid.append({"id": tag, "line": test["line"]})
+            elif tag not in reqs:
+                reqs.append(tag)
+        if test_id in tests:
+            duplicates.append({"id": test_id, "lines": [tests[test_id]["line"], test["line"]]})
+            continue
+        tests[test_id] = {"name": test["name"], "line": test["line"], "reqs": reqs}
+    return {"tests": tests, "duplicates": duplicates, "invalid": invalid}
+
+
+# ---------------------------------------------------------------------- #
+#  Index                                                                   #
+# ---------------------------------------------------------------------- #
+
+class TraceIndex:
+    """Merged requirement / test index with forward and reverse links."""
+
+    def __init__(self) -> None:
+        # REQ-ID -> {"title", "status", "implementation", "source", "line",
+        #            "tests": [documented TC-IDs]}
+        self.requirements: Dict[str, dict] = {}
+        # TC-ID -> {"name", "source", "line", "reqs": [tagged REQ-IDs]}
+        self.tests: Dict[str, dict] = {}
+        # REQ-ID -> [TC-IDs whose Robot tags name it]
+        self.tagged_by: Dict[str, List[str]] = {}
+        # TC-ID -> [REQ-IDs whose :Test Cases: field names it]
+        self.documented_in: Dict[str, List[str]] = {}
+        # [{"id", "sources": ["file:line" of first, of other]}] for IDs
+        # defined twice, in one source or across sources
+        self.duplicates: List[dict] = []
+        # [{"id", "source": "file:line"}] for REQ labels / tags not matching REQ_ID
+        self.invalid_ids: List[dict] = []
+
+    @classmethod
+    def from_fragments(cls, fragments: Iterable) -> "TraceIndex":
+        """Build an index from ``(source, fragment)`` pairs (docs and Robot)."""
+        index = cls()
+        for source, fragment in fragments:
+            for bad in fragment.get("invalid", []):
+                index.invalid_ids.append({"id": bad["id"], "source": f"{source}:{bad['line']}"})
+            for dup in fragment.get("duplicates", []):
+                index.duplicates.append(
+                    {"id": dup["id"], "sources": [f"{source}:{line}" for line in dup["lines"]]})
+            for table, key in (("requirements", index.requirements),
+                               ("tests", index.tests)):
+                for item_id, item in fragment.get(table, {}).items():
+                    if item_id in key:
+                        first = key[item_id]
+                        index.duplicates.append({"id": item_id, "sources": [
+                            f"{first['source']}:{first['line']}", f"{source}:{item['line']}"]})
+                        continue
+                    key[item_id] = dict(item, source=source)
+        for test_id, test in index.tests.items():
+            for req in test["reqs"]:
+                index.tagged_by.setdefault(req, []).append(test_id)
+        for req_id, req in index.requirements.items():
+            for test_id in req["tests"]:
+                index.documented_in.setdefault(test_id, []).append(req_id)
+        return index
+
+    def linked_tests(self, req_id: str) -> List[str]:
+        """Return existing tests linked to ``req_id`` from either side."""
+        linked = list(self.tagged_by.get(req_id, []))
+        for test_id in self.requirements.get(req_id, {}).get("tests", []):
+            if test_id in self.tests and test_id not in linked:
+                linked.append(test_id)
+        return sorted(linked)
+
+    def uncovered(self) -> List[str]:
+        """Return requirements with no linked, existing Robot test."""
+        return sorted(r for r in self.requirements if not self.linked_tests(r))
+
+    def mismatches(self) -> List[dict]:
+        """Return links declared on only one side.
+
+        ``kind`` is ``doc-only`` when ``:Test Cases:`` lists a test that does
+        not carry the requirement tag, and ``tag-only`` for the reverse.
+        """
+        result = []
+        for req_id, req in sorted(self.requirements.items()):
+            for test_id in req["tests"]:
+                if test_id in self.tests and req_id not in self.tests[test_id]["reqs"]:
+                    result.append({"kind": "doc-only", "req": req_id, "test": test_id})
+        for test_id, test in sorted(self.tests.items()):
+            for req_id in test["reqs"]:
+                if req_id in self.requirements and \
+                        test_id not in self.requirements[req_id]["tests"]:
+                    result.append({"kind": "tag-only", "req": req_id, "test": test_id})
+        return result
+
+    def unknown(self) -> List[dict]:
+        """Return references to requirements or tests that are not defined."""
+        result = []
+        for req_id, req in sorted(self.requirements.items()):
+            for test_id in req["tests"]:
+                if test_id not in self.tests:
+                    result.append({"kind": "unknown-test", "req": req_id, "test": test_id})
+        for test_id, test in sorted(self.tests.items()):
+            for req_id in test["reqs"]:
+                if req_id not in self.requirements:
+                    result.append({"kind": "unknown-req", "req": req_id, "test": test_id})
+        return result
+
+    def matrix(self) -> List[dict]:
+        """Return one row per requirement, in ID order, for reporting."""
+        return [
+            {
+                "req": req_id,
+                "title": req["title"],
+                "implementation": req["implementation"],
+                "status": req["status"],
+                "documented": req["tests"],
+                "tagged": sorted(self.tagged_by.get(req_id, [])),
+                "covered": bool(self.linked_tests(req_id)),
+            }
+            for req_id, req in sorted(self.requirements.items())
+        ]
+
+
+# ---------------------------------------------------------------------- #
+#  Cache                                                                   #
+# ---------------------------------------------------------------------- #
+
+def collect_sources(docs_dirs: Iterable, robot_dirs: Iterable) -> List[Path]:
+    """Return all ``*.rst`` files below ``docs_dirs`` and ``*.robot`` files
+    below ``robot_dirs`` (files are accepted as-is), sorted."""
+    files = set()
+    for roots, pattern in ((docs_dirs, "*.rst"), (robot_dirs, "*.robot")):
+        for root in roots:
+            root = Path(root)
+            if root.is_file():
+                files.add(root.resolve())
+            elif root.is_dir():
+                files.update(p.resolve() for p in root.rglob(pattern)
+                             if "_build" not in p.parts)
+            else:
+                raise FileNotFoundError(f"Traceability source not found: {root}")
+    return sorted(files)
+
+
+def _parse_source(path: Path, data: bytes) -> dict:
+    text = data.decode("utf-8")
+    return parse_robot(text) if path.suffix == ".robot" else parse_rst(text)
+
+
+def _display(path: Path) -> str:
+    try:
+        return path.relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def load_index(docs_dirs: Iterable = (DEFAULT_DOCS_DIR,),
+               robot_dirs: Iterable = (DEFAULT_ROBOT_DIR,),
+               cache_dir=DEFAULT_CACHE_DIR, use_cache: bool = True) -> TraceIndex:
+    """Parse (or load from cache) every source and return the merged index.
+
+    The cache is ``<cache_dir>/index.json``: one entry per source holding its
+    SHA-256 and parsed fragment.  Only sources whose digest changed are
+    reparsed; entries for deleted sources are dropped.
+    """
+    files = collect_sources(docs_dirs, robot_dirs)
+    cache_file = Path(cache_dir) / "index.json"
+    cached: Dict[str, dict] = {}
+    if use_cache:
+        try:
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+            if data.get("version") == CACHE_VERSION:
+                cached = data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    entries: Dict[str, dict] = {}
+    dirty = False
+    for path in files:
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        key = str(path)
+        entry = cached.get(key)
+        if entry is None or entry["digest"] != digest:
+            entry = {"digest": digest, "fragment": _parse_source(path, raw)}
+            dirty = True
+        entries[key] = entry
+    dirty = dirty or set(cached) != set(entries)
+
+    if use_cache and dirty:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": entries},
+                                  separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, cache_file)
+
+    return TraceIndex.from_fragments(
+        (_display(Path(key)), entry["fragment"]) for key, entry in entries.items()
+    )
+
+
+# ---------------------------------------------------------------------- #
+#  Command line                                                            #
+# ---------------------------------------------------------------------- #
+
+def _cmd_check(index: TraceIndex, args) -> int:
+    uncovered = index.uncovered()
+    mismatches = index.mismatches()
+    unknown = index.unknown()
+    for req_id in uncovered:
+        req = index.requirements[req_id]
+        print(f"UNCOVERED  {req_id}  ({req['source']}:{req['line']})")
+    for item in mismatches + unknown:
+        print(f"{item['kind'].upper():<10} {item['req']} <-> {item['test']}")
+    for item in index.duplicates:
+        print(f"DUPLICATE  {item['id']}  {item['sources'][0]}  {item['sources'][1]}")
+    for item in index.invalid_ids:
+        print(f"INVALID ID {item['id']}  ({item['source']})")
+    print(f"{len(index.requirements)} requirements, {len(index.tests)} tests: "
+          f"{len(uncovered)} uncovered, {len(mismatches)} mismatched, "
+          f"{len(unknown)} unknown, {len(index.duplicates)} duplicate, "
+          f"{len(index.invalid_ids)} invalid ID")
+    # A malformed ID silently drops a requirement or link, so it fails like
+    # an uncovered requirement.
+    if uncovered or index.invalid_ids:
+        return 1
+    if args.strict and (mismatches or unknown or index.duplicates):
+        return 1
+    return 0
+
+
+def _cmd_matrix(index: TraceIndex, args) -> int:
+    rows = index.matrix()
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return 0
+    print(f"{'Requirement':<14} {'Documented tests':<28} {'Tagged tests':<28} Status")
+    for row in rows:
+        print(f"{row['req']:<14} {', '.join(row['documented']) or '-':<28} "
+              f"{', '.join(row['tagged']) or '-':<28} "
+              f"{'covered' if row['covered'] else 'UNCOVERED'}")
+    return 0
+
+
+def _cmd_show(index: TraceIndex, args) -> int:
+    item = args.id
+    if item in index.requirements:
+        req = index.requirements[item]
+        print(f"{item} – {req['title']}  ({req['source']}:{req['line']})")
+        print(f"  documented tests: {', '.join(req['tests']) or '-'}")
+        print(f"  tagged by tests:  {', '.join(sorted(index.tagged_by.get(item, []))) or '-'}")
+        return 0
+    if item in index.tests:
+        test = index.tests[item]
+        print(f"{item} – {test['name']}  ({test['source']}:{test['line']})")
+        print(f"  tagged requirements:     {', '.join(test['reqs']) or '-'}")
+        print(f"  documented requirements: {', '.join(index.documented_in.get(item, [])) or '-'}")
+        return 0
+    print(f"No requirement or test named {item!r}", file=sys.stderr)
+    return 1
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Requirement <-> Robot test traceability checks.")
+    parser.add_argument("--docs", action="append", default=None,
+                        help="reST file or directory; repeatable (default: docs/)")
+    parser.add_argument("--robot", action="append", default=None,
+                        help="Robot suite file or directory; repeatable (default: tests/suites/)")
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="directory for the parsed-source cache")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="reparse every source; do not read or write the cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("check", help="fail if any requirement has no linked test "
+                                     "or a REQ ID is malformed")
+    p.add_argument("--strict", action="store_true",
+                   help="also fail on one-sided links, unknown IDs and duplicates")
+    p.set_defaults(func=_cmd_check)
+
+    p = sub.add_parser("matrix", help="print the requirement / test matrix")
+    p.add_argument("--json", action="store_true", help="emit JSON instead of a table")
+    p.set_defaults(func=_cmd_matrix)
+
+    p = sub.add_parser("show", help="show the links of one requirement or test")
+    p.add_argument("id")
+    p.set_defaults(func=_cmd_show)
+
+    args = parser.parse_args(argv)
+    try:
+        index = load_index(args.docs or [DEFAULT_DOCS_DIR],
+                           args.robot or [DEFAULT_ROBOT_DIR],
+                           cache_dir=args.cache_dir, use_cache=not args.no_cache)
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc))
+    return args.func(index, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
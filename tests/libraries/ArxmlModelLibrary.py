@@ -0,0 +1,357 @@
+"""
+ArxmlModelLibrary.py
+====================
+Robot Framework library for checking the ARXML model of
+``scripts/arxml_model.py`` against small, temporary ARXML projects.
+
+Each test builds its own project in a scratch workspace (sender/receiver and
+client/server interfaces, SWCs with ports), loads it with ``load_project``
+and asserts on the merged model: duplicate and conflict reports, interface
+reference resolution, fragment reuse by the cache and parse errors.
+
+Requirements
+------------
+  pip install robotframework
+
+Usage
+-----
+In a .robot file::
+
+    Library    ../libraries/ArxmlModelLibrary.py
+
+    Create Arxml Workspace
+    Add Sender Receiver Interface    a.arxml    /Pkg    SpeedIf    VehicleSpeed
+    Add Swc    b.arxml    /Pkg/Sub    Ctrl    P:Out:SpeedIf
+    Load Arxml Project
+    Port Should Resolve To    Ctrl    Out    /Pkg/SpeedIf
+"""
+
+import shutil
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+from arxml_model import INTERFACE_TAG, file_digest, load_project  # noqa: E402
+
+_NS = "http://autosar.org/schema/r4.0"
+
+# Port spec prefix -> (prototype tag, interface reference tag)
+_PORT_SPECS = {
+    "P": ("P-PORT-PROTOTYPE", "PROVIDED-INTERFACE-TREF"),
+    "R": ("R-PORT-PROTOTYPE", "REQUIRED-INTERFACE-TREF"),
+    "PR": ("PR-PORT-PROTOTYPE", "PROVIDED-REQUIRED-INTERFACE-TREF"),
+}
+
+
+class ArxmlModelLibrary:
+    """Robot Framework library for ARXML model, merge and cache checks."""
+
+    ROBOT_LIBRARY_SCOPE = "SUITE"
+    ROBOT_LIBRARY_VERSION = "1.0.0"
+
+    def __init__(self) -> None:
+        self._workspace: Optional[Path] = None
+        # file name -> package path -> [element XML, ...]
+        self._files: Dict[str, Dict[str, List[str]]] = {}
+        self._model = None
+        self._parsed: List[str] = []
+
+    # ------------------------------------------------------------------ #
+    #  Workspace helpers                                                   #
+    # ------------------------------------------------------------------ #
+
+    @property
+    def _root(self) -> Path:
+        if self._workspace is None:
+            raise RuntimeError("No ARXML workspace. Call 'Create Arxml Workspace' first.")
+        return self._workspace
+
+    @property
+    def _arxml_dir(self) -> Path:
+        return self._root / "arxml"
+
+    @property
+    def _cache_dir(self) -> Path:
+        return self._root / "cache"
+
+    def _render(self, packages: Dict[str, List[str]]) -> str:
+        # Build the nested AR-PACKAGE tree from the absolute package paths.
+        tree: dict = {}
+        for package, elements in packages.items():
+            node = tree
+            for part in package.strip("/").split("/"):
+                node = node.setdefault(part, {"elements": [], "children": {}})
+                last = node
+                node = node["children"]
+            last["elements"].extend(elements)
+
+        def render(children: dict) -> str:
+            out = []
+            for name, node in children.items():
+                body = f"<SHORT-NAME>{name}</SHORT-NAME>"
+                if node["elements"]:
+                    body += f"<ELEMENTS>{''.join(node['elements'])}</ELEMENTS>"
+                if node["children"]:
+                    body += f"<AR-PACKAGES>{render(node['children'])}</AR-PACKAGES>"
+                out.append(f"<AR-PACKAGE>{body}</AR-PACKAGE>")
+            return "".join(out)
+
+        return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+                f'<AUTOSAR xmlns="{_NS}"><AR-PACKAGES>{render(tree)}</AR-PACKAGES></AUTOSAR>\n')
+
+    def _add(self, file_name: str, package: str, element: str) -> None:
+        self._files.setdefault(file_name, {}).setdefault(package, []).append(element)
+        path = self._arxml_dir / file_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self._render(self._files[file_name]), encoding="utf-8")
+
+    def _fragment_state(self) -> Dict[str, int]:
+        fragments = self._cache_dir / "fragments"
+        return {p.name: p.stat().st_mtime_ns for p in fragments.glob("*.json")}
+
+    def _port(self, swc: str, port: str) -> dict:
+        for candidate in self._loaded().ports_of(swc):
+            if candidate["name"] == port:
+                return candidate
+        raise AssertionError(f"SWC {swc!r} has no port {port!r}")
+
+    def _loaded(self):
+        if self._model is None:
+            raise RuntimeError("No model loaded. Call 'Load Arxml Project' first.")
+        return self._model
+
+    # ------------------------------------------------------------------ #
+    #  Workspace keywords                                                  #
+    # ------------------------------------------------------------------ #
+
+    def create_arxml_workspace(self) -> str:
+        """Create an empty scratch workspace and return its path.
+
+        Example::
+
+            [Setup]    Create Arxml Workspace
+        """
+        self.remove_arxml_workspace()
+        self._workspace = Path(tempfile.mkdtemp(prefix="arxml-model-"))
+        return str(self._workspace)
+
+    def remove_arxml_workspace(self) -> None:
+        """Delete the scratch workspace and forget the loaded model.
+
+        Example::
+
+            [Teardown]    Remove Arxml Workspace
+        """
+        if self._workspace is not None:
+            shutil.rmtree(self._workspace, ignore_errors=True)
+        self._workspace = None
+        self._files = {}
+        self._model = None
+        self._parsed = []
+
+    def add_sender_receiver_interface(self, file_name: str, package: str, name: str,
+                                      *data_elements: str, desc: str = "") -> None:
+        """Add a sender/receiver interface with ``data_elements`` to ``file_name``.
+
+        ``desc`` adds a ``DESC`` text, which the model does not index but
+        which changes the element's content.
+
+        Example::
+
+            Add Sender Receiver Interface    a.arxml    /Pkg    SpeedIf    VehicleSpeed
+        """
+        desc_xml = f'<DESC><L-2 L="EN">{desc}</L-2></DESC>' if desc else ""
+        elements = "".join(
+            f"<VARIABLE-DATA-PROTOTYPE><SHORT-NAME>{e}</SHORT-NAME>"
+            "<TYPE-TREF>/DataTypes/uint16</TYPE-TREF></VARIABLE-DATA-PROTOTYPE>"
+            for e in data_elements
+        )
+        self._add(file_name, package,
+                  f"<{INTERFACE_TAG}><SHORT-NAME>{name}</SHORT-NAME>{desc_xml}"
+                  f"<DATA-ELEMENTS>{elements}</DATA-ELEMENTS></{INTERFACE_TAG}>")
+
+    def add_client_server_interface(self, file_name: str, package: str, name: str) -> None:
+        """Add an (operation-less) client/server interface to ``file_name``.
+
+        Example::
+
+            Add Client Server Interface    a.arxml    /Pkg    BrakeIf
+        """
+        self._add(file_name, package,
+                  f"<CLIENT-SERVER-INTERFACE><SHORT-NAME>{name}</SHORT-NAME>"
+                  "</CLIENT-SERVER-INTERFACE>")
+
+    def add_swc(self, file_name: str, package: str, name: str, *ports: str) -> None:
+        """Add an application SWC to ``file_name``.
+
+        Each port is ``DIRECTION:NAME:TREF`` with ``DIRECTION`` one of ``P``,
+        ``R`` or ``PR``; ``TREF`` is written verbatim (absolute or relative).
+
+        Example::
+
+            Add Swc    b.arxml    /Pkg/Sub    Ctrl    P:Out:/Pkg/SpeedIf    R:In:SpeedIf
+        """
+        xml = []
+        for spec in ports:
+            direction, port, tref = spec.split(":", 2)
+            proto, tref_tag = _PORT_SPECS[direction]
+            xml.append(f"<{proto}><SHORT-NAME>{port}</SHORT-NAME>"
+                       f"<{tref_tag}>{tref}</{tref_tag}></{proto}>")
+        self._add(file_name, package,
+                  "<APPLICATION-SOFTWARE-COMPONENT-TYPE>"
+                  f"<SHORT-NAME>{name}</SHORT-NAME><PORTS>{''.join(xml)}</PORTS>"
+                  "</APPLICATION-SOFTWARE-COMPONENT-TYPE>")
+
+    def reindent_arxml_file(self, file_name: str) -> None:
+        """Rewrite ``file_name`` with different indentation but the same content.
+
+        Example::
+
+            Reindent Arxml File    b.arxml
+        """
+        path = self._arxml_dir / file_name
+        ET.register_namespace("", _NS)
+        tree = ET.parse(path)
+        ET.indent(tree, space="    ")
+        tree.write(path, encoding="utf-8", xml_declaration=True)
+
+    def touch_arxml_file(self, file_name: str) -> None:
+        """Change the bytes of ``file_name`` without changing its model content.
+
+        Example::
+
+            Touch Arxml File    b.arxml
+        """
+        path = self._arxml_dir / file_name
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write("<!-- touched -->\n")
+
+    def write_invalid_arxml_file(self, file_name: str) -> None:
+        """Write a file that is not well-formed XML.
+
+        Example::
+
+            Write Invalid Arxml File    broken.arxml
+        """
+        path = self._arxml_dir / file_name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'<AUTOSAR xmlns="{_NS}"><AR-PACKAGES>\n', encoding="utf-8")
+
+    # ------------------------------------------------------------------ #
+    #  Loading keywords                                                    #
+    # ------------------------------------------------------------------ #
+
+    def load_arxml_project(self, jobs: int = 1, use_cache: bool = True) -> None:
+        """Load every file of the workspace with ``load_project``.
+
+        Records which files had to be parsed (rather than taken from the
+        fragment cache) for `Files Parsed By Last Load Should Be`.
+
+        Example::
+
+            Load Arxml Project    jobs=2
+        """
+        before = self._fragment_state()
+        self._model = load_project([str(self._arxml_dir)], cache_dir=self._cache_dir,
+                                   use_cache=use_cache, jobs=int(jobs))
+        after = self._fragment_state()
+        written = {name for name, mtime in after.items() if before.get(name) != mtime}
+        self._parsed = sorted(
+            Path(f).name for f in self._model.sources
+            if f"{file_digest(f)}.json" in written
+        )
+
+    def loading_arxml_should_fail_with_parse_error_in(self, file_name: str,
+                                                      jobs: int = 1) -> None:
+        """Assert that loading raises ``ParseError`` naming ``file_name``.
+
+        Example::
+
+            Loading Arxml Should Fail With Parse Error In    broken.arxml    jobs=2
+        """
+        try:
+            self.load_arxml_project(jobs=jobs, use_cache=False)
+        except ET.ParseError as exc:
+            filename = getattr(exc, "filename", None)
+            if filename is None or Path(filename).name != file_name:
+                raise AssertionError(
+                    f"ParseError names {filename!r}, expected {file_name!r}")
+            return
+        raise AssertionError("Loading the ARXML project did not raise ParseError")
+
+    # ------------------------------------------------------------------ #
+    #  Model assertions                                                    #
+    # ------------------------------------------------------------------ #
+
+    def element_should_be_reported_as(self, path: str, kind: str) -> None:
+        """Assert that ``path`` is reported once, as ``duplicate`` or ``conflict``.
+
+        Example::
+
+            Element Should Be Reported As    /Pkg/SpeedIf    duplicate
+        """
+        kinds = [e["kind"] for e in self._loaded().conflicts if e["path"] == path]
+        if kinds != [kind]:
+            raise AssertionError(f"{path} reported as {kinds}, expected [{kind!r}]")
+
+    def no_conflicts_should_be_reported(self) -> None:
+        """Assert that the merge reported no duplicates or conflicts.
+
+        Example::
+
+            No Conflicts Should Be Reported
+        """
+        conflicts = self._loaded().conflicts
+        if conflicts:
+            raise AssertionError(f"Unexpected merge reports: {conflicts}")
+
+    def port_should_resolve_to(self, swc: str, port: str, target: str,
+                               kind: str = INTERFACE_TAG) -> None:
+        """Assert that ``swc``.``port`` resolves to ``target`` of element type ``kind``.
+
+        Example::
+
+            Port Should Resolve To    Ctrl    Call    /Pkg/BrakeIf    CLIENT-SERVER-INTERFACE
+        """
+        found = self._port(swc, port)
+        if (found["target"], found["target_kind"]) != (target, kind):
+            raise AssertionError(
+                f"{swc}.{port} resolved to {found['target']!r} ({found['target_kind']}), "
+                f"expected {target!r} ({kind})")
+        expected_interface = target if kind == INTERFACE_TAG else None
+        if found["interface"] != expected_interface:
+            raise AssertionError(
+                f"{swc}.{port} interface is {found['interface']!r}, "
+                f"expected {expected_interface!r}")
+
+    def port_should_be_unresolved(self, swc: str, port: str) -> None:
+        """Assert that ``swc``.``port`` is listed as unresolved.
+
+        Example::
+
+            Port Should Be Unresolved    Ctrl    Missing
+        """
+        found = self._port(swc, port)
+        model = self._loaded()
+        if found["target"] is not None or \
+                [found["swc"], port, found["tref"]] not in model.unresolved:
+            raise AssertionError(
+                f"{swc}.{port} is not unresolved (target {found['target']!r})")
+
+    def files_parsed_by_last_load_should_be(self, *file_names: str) -> None:
+        """Assert which workspace files the last load parsed instead of
+        taking from the fragment cache (none when called without arguments).
+
+        Example::
+
+            Files Parsed By Last Load Should Be    b.arxml
+        """
+        if self._parsed != sorted(file_names):
+            raise AssertionError(
+                f"Parsed {self._parsed}, expected {sorted(file_names)}")
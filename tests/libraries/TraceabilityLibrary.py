@@ -0,0 +1,127 @@
+"""
+TraceabilityLibrary.py
+======================
+Robot Framework library for requirement <-> test traceability checks.
+
+Wraps the cached traceability index of ``scripts/traceability.py``, which
+links the ``:Test Cases:`` fields in ``docs/requirements.rst`` with the
+``REQ-*`` tags of the suites in ``tests/suites/``.  Only sources that changed
+since the last run are reparsed.
+
+Requirements
+------------
+  pip install robotframework
+
+Usage
+-----
+In a .robot file::
+
+    Library    ../libraries/TraceabilityLibrary.py
+
+    All Requirements Should Be Covered
+    Requirement Should Be Covered    REQ-FUNC-002
+"""
+
+import sys
+from pathlib import Path
+from typing import List
+
+_SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+if str(_SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPTS_DIR))
+
+from traceability import DEFAULT_DOCS_DIR, DEFAULT_ROBOT_DIR, load_index  # noqa: E402
+
+
+class TraceabilityLibrary:
+    """Robot Framework library for requirement traceability assertions."""
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+    ROBOT_LIBRARY_VERSION = "1.0.0"
+
+    def __init__(self, docs_dir: str = "", robot_dir: str = "") -> None:
+        self._docs_dir = docs_dir or str(DEFAULT_DOCS_DIR)
+        self._robot_dir = robot_dir or str(DEFAULT_ROBOT_DIR)
+
+    # ------------------------------------------------------------------ #
+    #  Index helpers                                                       #
+    # ------------------------------------------------------------------ #
+
+    def _index(self):
+        # Reloaded on every call so edits made during a run are seen; the
+        # on-disk cache keeps this cheap.
+        return load_index([self._docs_dir], [self._robot_dir])
+
+    # ------------------------------------------------------------------ #
+    #  Coverage keywords                                                   #
+    # ------------------------------------------------------------------ #
+
+    def all_requirements_should_be_covered(self) -> None:
+        """Assert that every requirement is linked to at least one Robot test.
+
+        A link counts from either side: the test ID in the requirement's
+        ``:Test Cases:`` field, or the requirement ID in the test's tags.
+        Also fails on malformed ``REQ-...`` labels or tags, which would
+        otherwise drop a requirement or link unnoticed.
+
+        Example::
+
+            All Requirements Should Be Covered
+        """
+        index = self._index()
+        uncovered = index.uncovered()
+        if uncovered:
+            raise AssertionError(
+                f"{len(uncovered)} requirement(s) without a linked Robot test: "
+                + ", ".join(uncovered)
+            )
+        if index.invalid_ids:
+            raise AssertionError(
+                f"{len(index.invalid_ids)} malformed requirement ID(s): "
+                + ", ".join(f"{i['id']} ({i['source']})" for i in index.invalid_ids)
+            )
+
+    def requirement_should_be_covered(self, requirement: str) -> None:
+        """Assert that ``requirement`` exists and has at least one linked test.
+
+        Example::
+
+            Requirement Should Be Covered    REQ-SW-005
+        """
+        index = self._index()
+        if requirement not in index.requirements:
+            raise AssertionError(f"Requirement {requirement!r} is not defined in the docs")
+        if not index.linked_tests(requirement):
+            raise AssertionError(f"Requirement {requirement!r} has no linked Robot test")
+
+    def traceability_should_be_consistent(self) -> None:
+        """Assert that the docs and the Robot tags agree on every link.
+
+        Fails on one-sided links (documented but not tagged, or tagged but
+        not documented), references to unknown IDs, duplicate IDs and
+        malformed requirement IDs.
+
+        Example::
+
+            Traceability Should Be Consistent
+        """
+        index = self._index()
+        problems = [
+            f"{item['kind']}: {item['req']} <-> {item['test']}"
+            for item in index.mismatches() + index.unknown()
+        ] + [f"duplicate: {item['id']}" for item in index.duplicates] \
+          + [f"invalid-id: {item['id']}" for item in index.invalid_ids]
+        if problems:
+            raise AssertionError(
+                f"{len(problems)} traceability problem(s):\n  " + "\n  ".join(problems)
+            )
+
+    def get_tests_for_requirement(self, requirement: str) -> List[str]:
+        """Return the IDs of all existing Robot tests linked to ``requirement``.
+
+        Example::
+
+            ${tests}=    Get Tests For Requirement    REQ-FUNC-002
+            Should Contain    ${tests}    TC-006
+        """
+        return self._index().linked_tests(requirement)
@@ -0,0 +1,253 @@
+"""
+run_suites.py
+=============
+Resource-aware runner for the Robot Framework suites in ``tests/suites/``.
+
+Every suite declares the resources it needs through ``Test Tags``:
+
+- ``board``        – needs the CYTVII-B-E-1M-SK board and the KitProg3 probe
+                     (OpenOCD).  Only one such suite may run at a time.
+- ``source-only``  – reads files from ``src/`` only; safe to run in parallel.
+
+Each suite runs in its own ``robot`` process.  Board suites queue on the
+single-slot board lane, in file-name order, while source-only suites run
+concurrently in a worker pool beside them.  A suite that declares neither tag
+is treated as board-bound.  When all suites have finished, the per-suite
+``output.xml`` files are combined with ``rebot`` into one log and report, so
+end-to-end time approaches the length of the board chain rather than the sum
+of all suites.  Each suite's console output is kept next to its output in
+``parts/<suite>/console.txt`` and echoed when the suite does not pass.
+
+Requirements
+------------
+  pip install -r tests/requirements.txt
+
+Usage
+-----
+::
+
+    python tests/run_suites.py
+    python tests/run_suites.py --jobs 4 --outputdir tests/results
+    python tests/run_suites.py --dry-plan             # print the schedule only
+    python tests/run_suites.py -- --variable OPENOCD_PORT:4445
+
+Arguments after ``--`` are passed to every ``robot`` invocation.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from robot.api import TestSuiteBuilder
+
+
+TESTS_DIR = Path(__file__).resolve().parent
+
+# Resource tag -> number of suites that may hold the resource at once.
+RESOURCE_CAPACITY = {"board": 1}
+
+SOURCE_ONLY_TAG = "source-only"
+
+
+# ---------------------------------------------------------------------- #
+#  Classification                                                          #
+# ---------------------------------------------------------------------- #
+
+def suite_resources(path: Path) -> List[str]:
+    """Return the resource tags declared by the tests in suite ``path``.
+
+    A suite whose every test is tagged ``source-only`` needs no resource
+    (empty list).  Otherwise the suite needs every resource in
+    `RESOURCE_CAPACITY` that any of its tests declares, and ``board`` when it
+    declares none at all.
+    """
+    suite = TestSuiteBuilder().build(str(path))
+    tags = [set(test.tags) for test in suite.all_tests]
+    if tags and all(SOURCE_ONLY_TAG in t for t in tags):
+        return []
+    declared = sorted({r for t in tags for r in t if r in RESOURCE_CAPACITY})
+    return declared or ["board"]
+
+
+def plan(suites: List[Path]) -> Dict[str, List[Path]]:
+    """Group ``suites`` into lanes: ``"parallel"`` plus one lane per resource.
+
+    A suite needing several resources is placed in the lane of the first one;
+    with only the ``board`` resource today this is always the board lane.
+    """
+    lanes: Dict[str, List[Path]] = {"parallel": []}
+    for resource in RESOURCE_CAPACITY:
+        lanes[resource] = []
+    for path in suites:
+        resources = suite_resources(path)
+        lanes[resources[0] if resources else "parallel"].append(path)
+    return lanes
+
+
+# ---------------------------------------------------------------------- #
+#  Execution                                                               #
+# ---------------------------------------------------------------------- #
+
+class _Result:
+    def __init__(self, suite: Path, lane: str, rc: int, start: float, end: float,
+                 output: Optional[Path]) -> None:
+        self.suite = suite
+        self.lane = lane
+        self.rc = rc
+        self.start = start
+        self.end = end
+        # None when this run's robot process wrote no output.xml
+        self.output = output
+
+
+def _run_robot(suite: Path, lane: str, parts_dir: Path, robot_args: List[str],
+               t0: float, print_lock: threading.Lock) -> _Result:
+    outdir = parts_dir / suite.stem
+    # Drop the previous run's results so a robot process that fails before
+    # writing output.xml cannot leave stale results to be merged.
+    shutil.rmtree(outdir, ignore_errors=True)
+    cmd = [
+        sys.executable, "-m", "robot",
+        "--outputdir", str(outdir),
+        "--output", "output.xml",
+        "--log", "NONE",
+        "--report", "NONE",
+        "--console", "dotted",
+        *robot_args,
+        str(suite),
+    ]
+    start = time.monotonic()
+    with print_lock:
+        print(f"[{start - t0:7.1f}s] start  {lane:<8} {suite.name}", flush=True)
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True)
+    end = time.monotonic()
+    outdir.mkdir(parents=True, exist_ok=True)
+    (outdir / "console.txt").write_text(proc.stdout, encoding="utf-8")
+    with print_lock:
+        print(f"[{end - t0:7.1f}s] finish {lane:<8} {suite.name} "
+              f"(rc={proc.returncode}, {end - start:.1f}s)", flush=True)
+        if proc.returncode != 0:
+            print(proc.stdout, flush=True)
+    output = outdir / "output.xml"
+    return _Result(suite, lane, proc.returncode, start, end,
+                   output if output.is_file() else None)
+
+
+def run_lanes(lanes: Dict[str, List[Path]], parts_dir: Path, jobs: int,
+              robot_args: List[str]) -> List[_Result]:
+    """Run every lane concurrently and return the results in submission order.
+
+    Resource lanes get an executor with one worker per unit of capacity, so
+    their suites queue on the resource; the parallel lane gets ``jobs``
+    workers.
+    """
+    t0 = time.monotonic()
+    print_lock = threading.Lock()
+    executors = []
+    futures = []
+    try:
+        for lane, suites in lanes.items():
+            if not suites:
+                continue
+            workers = jobs if lane == "parallel" else RESOURCE_CAPACITY[lane]
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=lane)
+            executors.append(executor)
+            futures.extend(
+                executor.submit(_run_robot, suite, lane, parts_dir, robot_args,
+                                t0, print_lock)
+                for suite in suites
+            )
+        return [f.result() for f in futures]
+    finally:
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+
+def merge_outputs(results: List[_Result], outputdir: Path, name: str,
+                  output: str, log: str, report: str) -> int:
+    """Combine the per-suite outputs of this run into one output, log and report."""
+    for r in results:
+        if r.output is None:
+            print(f"{r.suite.name} produced no output.xml (rc={r.rc}); "
+                  "left out of the merged report.", file=sys.stderr)
+    outputs = [str(r.output) for r in sorted(results, key=lambda r: r.suite.name)
+               if r.output is not None]
+    if not outputs:
+        print("No suite produced an output.xml; nothing to merge.", file=sys.stderr)
+        for stale in (output, log, report):
+            if stale.upper() != "NONE":
+                (outputdir / stale).unlink(missing_ok=True)
+        return 252
+    cmd = [
+        sys.executable, "-m", "robot.rebot",
+        "--name", name,
+        "--outputdir", str(outputdir),
+        "--output", output,
+        "--log", log,
+        "--report", report,
+        *outputs,
+    ]
+    return subprocess.run(cmd).returncode
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    robot_args: List[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, robot_args = argv[:split], argv[split + 1:]
+
+    parser = argparse.ArgumentParser(
+        description="Run Robot suites, overlapping source-only suites with the board chain.")
+    parser.add_argument("suites", nargs="*",
+                        help="suite files (default: tests/suites/*.robot)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="workers for source-only suites (default: one per CPU)")
+    parser.add_argument("--outputdir", default=str(TESTS_DIR / "results"),
+                        help="directory for the merged results (default: tests/results)")
+    parser.add_argument("--output", default="output.xml")
+    parser.add_argument("--log", default="log.html")
+    parser.add_argument("--report", default="report.html")
+    parser.add_argument("--name", default="Suites",
+                        help="name of the merged top-level suite (default: Suites)")
+    parser.add_argument("--dry-plan", action="store_true",
+                        help="print the lane assignment and exit")
+    args = parser.parse_args(argv)
+
+    suites = ([Path(s).resolve() for s in args.suites] if args.suites
+              else sorted((TESTS_DIR / "suites").glob("*.robot")))
+    lanes = plan(suites)
+    for lane, members in lanes.items():
+        print(f"{lane:<8}: {', '.join(p.name for p in members) or '-'}")
+    if args.dry_plan:
+        return 0
+
+    outputdir = Path(args.outputdir)
+    parts_dir = outputdir / "parts"
+    start = time.monotonic()
+    results = run_lanes(lanes, parts_dir, max(1, args.jobs), robot_args)
+    wall = time.monotonic() - start
+
+    busy = sum(r.end - r.start for r in results)
+    print(f"\nWall time {wall:.1f}s for {busy:.1f}s of suite time "
+          f"({len(results)} suites).")
+    for lane in lanes:
+        chain = sum(r.end - r.start for r in results if r.lane == lane)
+        if chain:
+            print(f"  {lane:<8} lane busy {chain:.1f}s")
+
+    rc = merge_outputs(results, outputdir, args.name, args.output, args.log, args.report)
+    errors = [r.rc for r in results if r.rc >= 251]
+    return max(errors) if errors else rc
+
+
+if __name__ == "__main__":
+    sys.exit(main())